@@ -3,37 +3,68 @@
 Demo script to demonstrate the min_cut_cli.py command-line utility.
 
 This script creates a simple example graph and shows how to use the min_cut_cli.py
-command-line utility to find the minimum cut between two nodes.
+command-line utility to find the minimum cut between two nodes. The CLI is run
+in-process so that all invocations share a single Neo4j connection.
 """
 
 from neo4j import GraphDatabase
-import subprocess
 import logging
+import os
 import sys
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+from mincut import MinCutFinder
+from min_cut_cli import format_output, main as cli_main
+
+# Configure logging (only if the importing application has not done so already)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Neo4j connection parameters
 URI = "bolt://localhost:7687"
 USERNAME = "neo4j"
-PASSWORD = "password"  # Change this to your Neo4j password
+PASSWORD = os.environ.get("NEO4J_PASSWORD", "password")  # Or change this to your Neo4j password
+DATABASE = None  # None uses the user's home database
+
+# Shared driver, created on first use and closed at the end of main()
+_DRIVER = None
 
-def create_example_graph():
+def _get_driver():
+    """
+    Get the demo's Neo4j driver, creating it on first use.
+    
+    Returns:
+        neo4j.Driver: Driver shared by all demo steps
+    """
+    global _DRIVER
+    if _DRIVER is None:
+        _DRIVER = GraphDatabase.driver(
+            URI,
+            auth=(USERNAME, PASSWORD),
+            max_connection_pool_size=10,
+            connection_acquisition_timeout=30
+        )
+    return _DRIVER
+
+def _close_driver():
+    """Close the shared driver if it was created."""
+    global _DRIVER
+    if _DRIVER is not None:
+        _DRIVER.close()
+        _DRIVER = None
+
+def create_example_graph(driver):
     """
     Create a simple example graph for demonstrating the min-cut CLI.
     
+    Args:
+        driver: Neo4j driver to use
+    
     Returns:
         tuple: (source_id, target_id) - IDs of the source and target nodes
     """
-    driver = GraphDatabase.driver(URI, auth=(USERNAME, PASSWORD))
-    
     try:
-        with driver.session() as session:
-            # Clean up any existing example data
-            session.run("MATCH (n:CliDemo) DETACH DELETE n")
-            
+        with driver.session(database=DATABASE) as session:
             # Create a simple graph with a clear min-cut
             # This creates a "butterfly" graph with a narrow waist
             #
@@ -44,16 +75,24 @@ def create_example_graph():
             #      C --- E
             #
             # The min-cut between A and F consists of the edges D-F and E-F
+            #
+            # Any existing example data is removed, the graph is created and the
+            # source/target IDs are returned in a single round-trip. The
+            # OPTIONAL MATCH + count(*) keeps exactly one row flowing into CREATE
+            # even when there is nothing to delete.
             
             logger.info("Creating example graph for min-cut CLI demo...")
             query = """
+            OPTIONAL MATCH (n:CliDemo)
+            DETACH DELETE n
+            WITH count(*) AS _
             CREATE 
-              (a:CliDemo {name: 'A'}),
-              (b:CliDemo {name: 'B'}),
-              (c:CliDemo {name: 'C'}),
-              (d:CliDemo {name: 'D'}),
-              (e:CliDemo {name: 'E'}),
-              (f:CliDemo {name: 'F'}),
+              (a:CliDemo {name: $a_name}),
+              (b:CliDemo {name: $b_name}),
+              (c:CliDemo {name: $c_name}),
+              (d:CliDemo {name: $d_name}),
+              (e:CliDemo {name: $e_name}),
+              (f:CliDemo {name: $f_name}),
               (a)-[:DEMO_REL]->(b),
               (a)-[:DEMO_REL]->(c),
               (b)-[:DEMO_REL]->(d),
@@ -62,136 +101,131 @@ def create_example_graph():
               (e)-[:DEMO_REL]->(f),
               (b)-[:DEMO_REL]->(e),
               (c)-[:DEMO_REL]->(d)
-            RETURN a, f
-            """
-            
-            session.run(query)
-            logger.info("Created example graph with 6 nodes and 8 relationships")
-            
-            # Get node IDs for source and target
-            query = """
-            MATCH (source:CliDemo {name: 'A'})
-            MATCH (target:CliDemo {name: 'F'})
-            RETURN elementId(source) as source_id, elementId(target) as target_id
+            RETURN elementId(a) AS source_id, elementId(f) AS target_id
             """
             
-            result = session.run(query)
+            result = session.run(
+                query,
+                a_name="A", b_name="B", c_name="C",
+                d_name="D", e_name="E", f_name="F"
+            )
             record = result.single()
             
             if not record:
                 logger.error("Failed to get node IDs")
                 return None, None
             
+            logger.info("Created example graph with 6 nodes and 8 relationships")
+            
             source_id = record["source_id"]
             target_id = record["target_id"]
             
-            logger.info(f"Source node (A) ID: {source_id}")
-            logger.info(f"Target node (F) ID: {target_id}")
+            logger.info("Source node (A) ID: %s", source_id)
+            logger.info("Target node (F) ID: %s", target_id)
             
             return source_id, target_id
             
     except Exception as e:
-        logger.error(f"Error creating example graph: {str(e)}")
+        logger.error("Error creating example graph: %s", e)
         return None, None
-    finally:
-        driver.close()
 
-def demonstrate_cli(source_id, target_id):
+def _cli_argv(source_id, target_id, *extra_args):
     """
-    Demonstrate the min_cut_cli.py command-line utility.
+    Build the min_cut_cli.py argument list for the demo graph.
     
     Args:
         source_id: ID of the source node
         target_id: ID of the target node
+        extra_args: Additional command-line arguments
+        
+    Returns:
+        list: Command-line arguments for min_cut_cli.main
     """
-    if source_id is None or target_id is None:
-        logger.error("Cannot demonstrate CLI without valid node IDs")
-        return
-    
-    logger.info("\n=== Running min_cut_cli.py with text output (default) ===")
-    text_cmd = [
-        "python", "min_cut_cli.py",
+    return [
         "--start-node", str(source_id),
         "--end-node", str(target_id),
         "--node-labels", "CliDemo",
         "--relationship-types", "DEMO_REL",
-        "--username", USERNAME,
-        "--password", PASSWORD
+        # create_example_graph already returns element IDs
+        "--element-ids",
+        *extra_args
     ]
-    subprocess.run(text_cmd)
+
+def run_formats(finder, source_id, target_id, formats=("text", "table", "json")):
+    """
+    Show the min_cut_cli.py output formats for the demo graph.
     
-    logger.info("\n=== Running min_cut_cli.py with table output ===")
-    table_cmd = [
-        "python", "min_cut_cli.py",
-        "--start-node", str(source_id),
-        "--end-node", str(target_id),
-        "--node-labels", "CliDemo",
-        "--relationship-types", "DEMO_REL",
-        "--output-format", "table",
-        "--username", USERNAME,
-        "--password", PASSWORD
-    ]
-    subprocess.run(table_cmd)
+    The output formats only differ in presentation, so the min-cut is computed
+    once and then rendered with each formatter.
     
-    logger.info("\n=== Running min_cut_cli.py with JSON output ===")
-    json_cmd = [
-        "python", "min_cut_cli.py",
-        "--start-node", str(source_id),
-        "--end-node", str(target_id),
-        "--node-labels", "CliDemo",
-        "--relationship-types", "DEMO_REL",
-        "--output-format", "json",
-        "--username", USERNAME,
-        "--password", PASSWORD
-    ]
-    subprocess.run(json_cmd)
+    Args:
+        finder: Connected MinCutFinder to compute the min-cut with
+        source_id: ID of the source node
+        target_id: ID of the target node
+        formats: Output formats to demonstrate
+    """
+    min_cut = finder.find_min_cut(source_id, target_id, ["DEMO_REL"], ["CliDemo"])
+    
+    for output_format in formats:
+        logger.info("\n=== min_cut_cli.py %s output ===", output_format)
+        print(format_output(min_cut, output_format))
+
+def demonstrate_cli(finder, source_id, target_id):
+    """
+    Demonstrate the min_cut_cli.py command-line utility.
+    
+    Args:
+        finder: Connected MinCutFinder shared by all invocations
+        source_id: ID of the source node
+        target_id: ID of the target node
+    """
+    if source_id is None or target_id is None:
+        logger.error("Cannot demonstrate CLI without valid node IDs")
+        return
+    
+    run_formats(finder, source_id, target_id)
     
     logger.info("\n=== Running min_cut_cli.py with timing information ===")
-    timing_cmd = [
-        "python", "min_cut_cli.py",
-        "--start-node", str(source_id),
-        "--end-node", str(target_id),
-        "--node-labels", "CliDemo",
-        "--relationship-types", "DEMO_REL",
-        "--show-timing",
-        "--username", USERNAME,
-        "--password", PASSWORD
-    ]
-    subprocess.run(timing_cmd)
+    cli_main(_cli_argv(source_id, target_id, "--show-timing"), finder=finder)
 
-def cleanup():
+def cleanup(driver):
     """
     Clean up the example graph.
-    """
-    driver = GraphDatabase.driver(URI, auth=(USERNAME, PASSWORD))
     
+    Args:
+        driver: Neo4j driver to use
+    """
     try:
-        with driver.session() as session:
+        with driver.session(database=DATABASE) as session:
             session.run("MATCH (n:CliDemo) DETACH DELETE n")
             logger.info("Cleaned up example graph")
     except Exception as e:
-        logger.error(f"Error cleaning up: {str(e)}")
-    finally:
-        driver.close()
+        logger.error("Error cleaning up: %s", e)
 
 def main():
     """
     Main function to run the demo.
     """
     logger.info("Starting Min-Cut CLI Demo")
+    driver = _get_driver()
+    # The finder runs on the demo's driver, so the whole demo uses one pool
+    finder = MinCutFinder(URI, USERNAME, PASSWORD, database=DATABASE, driver=driver)
     
     try:
         # Create the example graph and get node IDs
-        source_id, target_id = create_example_graph()
+        source_id, target_id = create_example_graph(driver)
         
         if source_id is not None and target_id is not None:
             # Demonstrate the CLI
-            demonstrate_cli(source_id, target_id)
+            finder.connect()
+            demonstrate_cli(finder, source_id, target_id)
     except Exception as e:
-        logger.error(f"Error in demo: {str(e)}")
+        logger.error("Error in demo: %s", e)
     finally:
         # Clean up
-        cleanup()
+        finder.close()
+        cleanup(driver)
+        _close_driver()
         logger.info("Demo completed")
 
 if __name__ == "__main__":
@@ -9,8 +9,9 @@ It is designed to be a quick demonstration of the min-cut implementation.
 from mincut import MinCutFinder
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging (only if the importing application has not done so already)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
@@ -20,18 +21,16 @@ def run_example():
     uri = "bolt://localhost:7687"
     user = "neo4j"
     password = ""
+    database = None  # None uses the user's home database
     
-    finder = MinCutFinder(uri, user, password)
+    finder = MinCutFinder(uri, user, password, database=database)
     
     try:
         # Connect to Neo4j
         finder.connect()
         
         # Create a simple example graph
-        with finder.driver.session() as session:
-            # Clean up any existing example data
-            session.run("MATCH (n:ExampleNode) DETACH DELETE n")
-            
+        with finder.driver.session(database=database) as session:
             # Create a simple graph with a clear min-cut
             # This creates a "butterfly" graph with a narrow waist
             #
@@ -42,15 +41,21 @@ def run_example():
             #      C --- E
             #
             # The min-cut between A and F consists of the edges D-F and E-F
+            #
+            # Clean up any existing example data, create the graph and get the
+            # source/target IDs in one query
             
             query = """
+            OPTIONAL MATCH (n:ExampleNode)
+            DETACH DELETE n
+            WITH count(*) AS _
             CREATE 
-              (a:ExampleNode {name: 'A'}),
-              (b:ExampleNode {name: 'B'}),
-              (c:ExampleNode {name: 'C'}),
-              (d:ExampleNode {name: 'D'}),
-              (e:ExampleNode {name: 'E'}),
-              (f:ExampleNode {name: 'F'}),
+              (a:ExampleNode {name: $a_name}),
+              (b:ExampleNode {name: $b_name}),
+              (c:ExampleNode {name: $c_name}),
+              (d:ExampleNode {name: $d_name}),
+              (e:ExampleNode {name: $e_name}),
+              (f:ExampleNode {name: $f_name}),
               (a)-[:EXAMPLE_REL]->(b),
               (a)-[:EXAMPLE_REL]->(c),
               (b)-[:EXAMPLE_REL]->(d),
@@ -59,21 +64,16 @@ def run_example():
               (e)-[:EXAMPLE_REL]->(f),
               (b)-[:EXAMPLE_REL]->(e),
               (c)-[:EXAMPLE_REL]->(d)
-            RETURN a, f
-            """
-            
-            session.run(query)
-            print("Created example graph with 6 nodes and 8 relationships")
-            
-            # Get node IDs for source and target
-            query = """
-            MATCH (source:ExampleNode {name: 'A'})
-            MATCH (target:ExampleNode {name: 'F'})
-            RETURN elementId(source) as source_id, elementId(target) as target_id
+            RETURN elementId(a) AS source_id, elementId(f) AS target_id
             """
             
-            result = session.run(query)
+            result = session.run(
+                query,
+                a_name="A", b_name="B", c_name="C",
+                d_name="D", e_name="E", f_name="F"
+            )
             record = result.single()
+            print("Created example graph with 6 nodes and 8 relationships")
             
             source_id = record["source_id"]
             target_id = record["target_id"]
@@ -92,18 +92,21 @@ def run_example():
         # Display the results
         print(f"\nFound {len(min_cut)} relationships in the min-cut:")
         
-        with finder.driver.session() as session:
-            for i, rel in enumerate(min_cut):
-                rel_id = rel["id"]
-                query = """
-                MATCH (a)-[r]->(b) WHERE elementId(r) = $rel_id
-                RETURN a.name as source, b.name as target
-                """
-                
-                result = session.run(query, rel_id=rel_id)
-                record = result.single()
-                
-                print(f"  {i+1}. {record['source']} -> {record['target']}")
+        # Look up the endpoint names of all min-cut relationships in one query
+        rel_ids = [rel["id"] for rel in min_cut]
+        with finder.driver.session(database=database) as session:
+            query = """
+            UNWIND $rel_ids AS rel_id
+            MATCH (a)-[r]->(b) WHERE elementId(r) = rel_id
+            RETURN rel_id, a.name as source, b.name as target
+            """
+            
+            result = session.run(query, rel_ids=rel_ids)
+            name_map = {record["rel_id"]: (record["source"], record["target"]) for record in result}
+        
+        for i, rel_id in enumerate(rel_ids):
+            source, target = name_map[rel_id]
+            print(f"  {i+1}. {source} -> {target}")
         
         print("\nThe min-cut effectively separates the graph into two components:")
         print("  Component 1: Contains node A (the start node)")
@@ -111,7 +114,7 @@ def run_example():
         print("\nRemoving these relationships would disconnect A from F with the minimum number of cuts.")
         
         # Clean up
-        #with finder.driver.session() as session:
+        #with finder.driver.session(database=database) as session:
         #    session.run("MATCH (n:ExampleNode) DETACH DELETE n")
         
     except Exception as e:
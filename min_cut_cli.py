@@ -9,28 +9,51 @@ allowing users to find the minimum cut between two nodes in a Neo4j graph.
 import argparse
 import json
 import logging
+import os
 import sys
-from typing import List, Dict, Any, Optional, Union
-
-from mincut import find_min_cut
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()
-    ]
-)
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Iterator, Optional, TextIO, Tuple, Union
+
+from mincut import find_min_cut, MinCutFinder
+
+# Configure logging (only if the importing application has not done so already)
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.StreamHandler()
+        ]
+    )
 logger = logging.getLogger(__name__)
 
+NO_MIN_CUT_MESSAGE = "No min-cut found. The nodes might be disconnected or in the same component."
+
 
-def parse_args() -> argparse.Namespace:
+@lru_cache(maxsize=128)
+def parse_list_arg(arg_value: str) -> Tuple[str, ...]:
     """
-    Parse command-line arguments.
+    Parse a comma-separated string into a tuple of strings.
+    
+    The result is cached, so repeated in-process invocations with the same
+    argument do not split it again. A tuple is returned so that the cached
+    value cannot be mutated by callers.
     
+    Args:
+        arg_value (str): Comma-separated string
+        
     Returns:
-        argparse.Namespace: Parsed command-line arguments
+        Tuple[str, ...]: Tuple of strings
+    """
+    return tuple(item.strip() for item in arg_value.split(","))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+    
+    Returns:
+        argparse.ArgumentParser: Parser for the min-cut command-line arguments
     """
     parser = argparse.ArgumentParser(
         description="Find the minimum cut between two nodes in a Neo4j graph.",
@@ -40,25 +63,30 @@ def parse_args() -> argparse.Namespace:
     # Required arguments
     parser.add_argument(
         "--start-node", 
-        type=int, 
+        type=str, 
         required=True, 
-        help="ID of the start node"
+        help="ID of the start node (integer node ID, or element ID with --element-ids)"
     )
     parser.add_argument(
         "--end-node", 
-        type=int, 
+        type=str, 
         required=True, 
-        help="ID of the end node"
+        help="ID of the end node (integer node ID, or element ID with --element-ids)"
+    )
+    parser.add_argument(
+        "--element-ids", 
+        action="store_true", 
+        help="Treat --start-node and --end-node as element IDs, skipping the ID lookup"
     )
     parser.add_argument(
         "--node-labels", 
-        type=str, 
+        type=parse_list_arg, 
         required=True, 
         help="Node labels to consider (comma-separated)"
     )
     parser.add_argument(
         "--relationship-types", 
-        type=str, 
+        type=parse_list_arg, 
         required=True, 
         help="Relationship types to traverse (comma-separated)"
     )
@@ -79,8 +107,15 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--password", 
         type=str, 
-        default="password", 
-        help="Neo4j password"
+        default=None, 
+        help="Neo4j password; prefer setting the NEO4J_PASSWORD environment variable "
+             "so the password does not appear in the process list (falls back to 'password')"
+    )
+    parser.add_argument(
+        "--database", 
+        type=str, 
+        default=None, 
+        help="Neo4j database to run the queries against; the user's home database if omitted"
     )
 
     # Additional arguments
@@ -97,6 +132,11 @@ def parse_args() -> argparse.Namespace:
         default="text", 
         help="Output format"
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write JSON output without indentation (smaller and faster for large cuts)"
+    )
     parser.add_argument(
         "--output-file", 
         type=str, 
@@ -113,17 +153,48 @@ def parse_args() -> argparse.Namespace:
         help="Show timing information for each step of the min-cut algorithm"
     )
 
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import; argparse parsers can be reused across parse_args calls
+_PARSER = _build_parser()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    
+    Args:
+        argv (Optional[List[str]]): Arguments to parse (defaults to sys.argv[1:])
+        
+    Returns:
+        argparse.Namespace: Parsed command-line arguments
+    """
+    args = _PARSER.parse_args(argv)
+    if not args.element_ids:
+        try:
+            args.start_node = int(args.start_node)
+            args.end_node = int(args.end_node)
+        except ValueError:
+            _PARSER.error("--start-node and --end-node must be integer node IDs unless --element-ids is given")
+    return args
 
 
 def setup_logging(verbose: bool, show_timing: bool) -> None:
     """
     Configure logging level based on verbosity and timing requirements.
     
+    Only logger levels are changed; no handlers are added, so this is safe to
+    call on every in-process invocation of main().
+    
     Args:
         verbose (bool): Whether to enable verbose logging
         show_timing (bool): Whether to show timing information
     """
+    # Reset the mincut logger to its default level so a previous --show-timing
+    # run does not leak into the next in-process invocation
+    logging.getLogger('mincut').setLevel(logging.WARNING)
+    
     if verbose:
         logger.setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
@@ -136,126 +207,228 @@ def setup_logging(verbose: bool, show_timing: bool) -> None:
         logger.setLevel(logging.INFO)
 
 
-def parse_list_arg(arg_value: str) -> List[str]:
+def _iter_output_lines(min_cut: List[Dict[str, Any]], output_format: str) -> Iterator[str]:
     """
-    Parse a comma-separated string into a list of strings.
+    Generate the lines of the table or text output, one relationship at a time.
     
     Args:
-        arg_value (str): Comma-separated string
+        min_cut (List[Dict[str, Any]]): Non-empty list of min-cut relationships
+        output_format (str): Output format (table, text)
+        
+    Yields:
+        str: Output lines without trailing newlines
+    """
+    if output_format == "table":
+        # Create a table-like output
+        yield "| ID | Source | Target | Type |"
+        yield "|----|--------|--------|------|"
+        
+        for rel in min_cut:
+            yield f"| {rel['id']} | {rel['source']} | {rel['target']} | {rel['type']} |"
+    
+    else:  # text format
+        yield f"Found {len(min_cut)} relationships in the min-cut:"
+        
+        for i, rel in enumerate(min_cut):
+            yield f"  {i+1}. ID: {rel['id']}, From: {rel['source']}, To: {rel['target']}, Type: {rel['type']}"
+
+
+def _json_options(compact: bool) -> Dict[str, Any]:
+    """
+    Get the json.dump/json.dumps keyword arguments for the JSON output format.
+    
+    Args:
+        compact (bool): Whether to omit indentation and whitespace
         
     Returns:
-        List[str]: List of strings
+        Dict[str, Any]: Keyword arguments for json.dump and json.dumps
     """
-    return [item.strip() for item in arg_value.split(",")]
+    if compact:
+        return {"separators": (",", ":")}
+    return {"indent": 2}
 
 
-def format_output(min_cut: List[Dict[str, Any]], output_format: str) -> str:
+def format_output(min_cut: List[Dict[str, Any]], output_format: str, compact: bool = False) -> str:
     """
     Format the min-cut results according to the specified output format.
     
     Args:
         min_cut (List[Dict[str, Any]]): List of min-cut relationships
         output_format (str): Output format (json, table, text)
+        compact (bool): Whether to write JSON without indentation
         
     Returns:
         str: Formatted output
     """
     if not min_cut:
-        return "No min-cut found. The nodes might be disconnected or in the same component."
+        return NO_MIN_CUT_MESSAGE
 
     if output_format == "json":
-        return json.dumps(min_cut, indent=2)
+        return json.dumps(min_cut, **_json_options(compact))
     
-    elif output_format == "table":
-        if not min_cut:
-            return "No min-cut relationships found."
-        
-        # Create a table-like output
-        header = "| ID | Source | Target | Type |"
-        separator = "|----|--------|--------|------|"
-        rows = []
-        
-        for rel in min_cut:
-            row = f"| {rel['id']} | {rel['source']} | {rel['target']} | {rel['type']} |"
-            rows.append(row)
-        
-        return "\n".join([header, separator] + rows)
+    return "\n".join(_iter_output_lines(min_cut, output_format))
+
+
+def write_output(
+    min_cut: List[Dict[str, Any]],
+    output_format: str,
+    out: TextIO,
+    compact: bool = False
+) -> None:
+    """
+    Write the min-cut results to a stream without building the full output first.
     
-    else:  # text format
-        if not min_cut:
-            return "No min-cut relationships found."
-        
-        lines = [f"Found {len(min_cut)} relationships in the min-cut:"]
-        
-        for i, rel in enumerate(min_cut):
-            lines.append(f"  {i+1}. ID: {rel['id']}, From: {rel['source']}, To: {rel['target']}, Type: {rel['type']}")
-        
-        return "\n".join(lines)
+    Args:
+        min_cut (List[Dict[str, Any]]): List of min-cut relationships
+        output_format (str): Output format (json, table, text)
+        out (TextIO): Stream to write to
+        compact (bool): Whether to write JSON without indentation
+    """
+    if not min_cut:
+        out.write(NO_MIN_CUT_MESSAGE + "\n")
+        return
+
+    if output_format == "json":
+        json.dump(min_cut, out, **_json_options(compact))
+        out.write("\n")
+        return
+    
+    for line in _iter_output_lines(min_cut, output_format):
+        out.write(line + "\n")
 
 
-def save_to_file(content: str, filepath: str) -> None:
+class _Tee:
+    """Minimal writable stream that forwards every write to several streams."""
+    
+    def __init__(self, *streams: TextIO):
+        self.streams = streams
+    
+    def write(self, data: str) -> None:
+        for stream in self.streams:
+            stream.write(data)
+
+
+def save_to_file(writer_fn: Callable[[TextIO], None], filepath: str) -> bool:
     """
-    Save content to a file.
+    Open a file with a large write buffer and let writer_fn stream into it.
     
     Args:
-        content (str): Content to save
+        writer_fn (Callable[[TextIO], None]): Function writing the content to the open file
         filepath (str): Path to the output file
+        
+    Returns:
+        bool: False if the file could not be opened, True once writer_fn has completed
     """
     try:
-        with open(filepath, "w") as f:
-            f.write(content)
-        logger.info(f"Results saved to {filepath}")
-    except Exception as e:
-        logger.error(f"Failed to save results to {filepath}: {str(e)}")
+        f = open(filepath, "w", buffering=1 << 20)
+    except OSError as e:
+        logger.error("Failed to save results to %s: %s", filepath, e)
+        return False
+    
+    with f:
+        writer_fn(f)
+    logger.info("Results saved to %s", filepath)
+    return True
 
 
-def main() -> int:
+def resolve_password(args: argparse.Namespace) -> str:
+    """
+    Get the Neo4j password from the arguments or the environment.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+        
+    Returns:
+        str: --password if given, else $NEO4J_PASSWORD, else the default 'password'
+    """
+    if args.password is not None:
+        return args.password
+    return os.environ.get("NEO4J_PASSWORD", "password")
+
+
+def run_min_cut(
+    args: argparse.Namespace,
+    finder: Optional[MinCutFinder] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run the min-cut algorithm for the parsed command-line arguments.
+    
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+        finder (Optional[MinCutFinder]): Connected finder to reuse; when omitted,
+            a new connection is made using the connection arguments
+        
+    Returns:
+        List[Dict[str, Any]]: List of min-cut relationships
+    """
+    node_labels = args.node_labels
+    relationship_types = args.relationship_types
+    
+    logger.debug("Finding min-cut from node %s to %s", args.start_node, args.end_node)
+    logger.debug("Node labels: %s", node_labels)
+    logger.debug("Relationship types: %s", relationship_types)
+    logger.debug("Max path length: %s", args.max_path_length)
+    
+    if finder is not None:
+        start_node_id, end_node_id = args.start_node, args.end_node
+        if not args.element_ids:
+            start_node_id, end_node_id = finder.get_element_ids_from_ids(
+                [start_node_id, end_node_id]
+            )
+        return finder.find_min_cut(
+            start_node_id,
+            end_node_id,
+            relationship_types,
+            node_labels,
+            args.max_path_length
+        )
+    
+    logger.debug("Neo4j URI: %s", args.uri)
+    return find_min_cut(
+        start_node_id=args.start_node,
+        end_node_id=args.end_node,
+        node_labels=node_labels,
+        relationship_types=relationship_types,
+        max_path_length=args.max_path_length,
+        uri=args.uri,
+        user=args.username,
+        password=resolve_password(args),
+        ids_are_node_ids=not args.element_ids,
+        database=args.database
+    )
+
+
+def main(argv: Optional[List[str]] = None, finder: Optional[MinCutFinder] = None) -> int:
     """
     Main function to run the command-line utility.
     
+    Args:
+        argv (Optional[List[str]]): Arguments to parse (defaults to sys.argv[1:])
+        finder (Optional[MinCutFinder]): Connected finder to reuse across calls
+    
     Returns:
         int: Exit code (0 for success, non-zero for failure)
     """
-    args = parse_args()
+    args = parse_args(argv)
     setup_logging(args.verbose, args.show_timing)
     
     try:
-        # Parse list arguments
-        node_labels = parse_list_arg(args.node_labels)
-        relationship_types = parse_list_arg(args.relationship_types)
-        
-        logger.debug(f"Finding min-cut from node {args.start_node} to {args.end_node}")
-        logger.debug(f"Node labels: {node_labels}")
-        logger.debug(f"Relationship types: {relationship_types}")
-        logger.debug(f"Max path length: {args.max_path_length}")
-        logger.debug(f"Neo4j URI: {args.uri}")
-        
-
         # Run the min-cut algorithm
-        min_cut = find_min_cut(
-            start_node_id=args.start_node,
-            end_node_id=args.end_node,
-            node_labels=node_labels,
-            relationship_types=relationship_types,
-            max_path_length=args.max_path_length,
-            uri=args.uri,
-            user=args.username,
-            password=args.password,
-            ids_are_node_ids=True
-        )
+        min_cut = run_min_cut(args, finder)
+        
+        def write_results(out: TextIO) -> None:
+            write_output(min_cut, args.output_format, out, args.compact)
         
-        # Format and display the results
-        #output = format_output(min_cut, args.output_format)
-        #print(output)
-        print(f"size of cut: {len(min_cut)}")
-        # Save to file if requested
-        if args.output_file:
-            save_to_file(output, args.output_file)
+        # Display the results, writing them to the output file in the same
+        # pass if requested
+        if args.output_file and save_to_file(lambda f: write_results(_Tee(sys.stdout, f)), args.output_file):
+            return 0
         
+        write_results(sys.stdout)
         return 0
     
     except Exception as e:
-        logger.error(f"Error: {str(e)}")
+        logger.error("Error: %s", e)
         if args.verbose:
             logger.exception("Detailed error information:")
         return 1
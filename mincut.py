@@ -5,21 +5,491 @@ This module provides functionality to find the minimum cut between two nodes in
 using Neo4j and the Graph Data Science (GDS) library.
 """
 
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase, GraphDatabase, RoutingControl
 from neo4j.exceptions import Neo4jError
+from functools import lru_cache
+import asyncio
+import atexit
 import logging
 import time
+import uuid
 
-# Configure logging
-#logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logging.basicConfig(level=logging.CRITICAL + 1, format='%(asctime)s - %(levelname)s - %(message)s')
-
+# A library must not configure the root logger: that is left to the importing
+# application. Progress and timing messages are INFO, so they stay hidden until
+# the application lowers this logger's level.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+logger.setLevel(logging.WARNING)
+
+# Bolt driver settings tuned for this workload: a bounded pool shared by all
+# finders, long-lived keep-alive connections, and a large fetch size so path and
+# relationship results arrive in few PULL round-trips
+DRIVER_CONFIG = {
+    "max_connection_pool_size": 50,
+    "connection_acquisition_timeout": 60,
+    "max_connection_lifetime": 3600,
+    "keep_alive": True,
+    "fetch_size": 10000,
+}
+
+
+# Shared drivers keyed by (uri, user, password)
+_DRIVERS = {}
+
+
+def _get_driver(uri, user, password):
+    """
+    Get the shared Neo4j driver for the given connection parameters.
+    
+    Drivers own a connection pool and are expensive to create, so one driver is
+    created per (uri, user, password) and reused by every MinCutFinder.
+    
+    Returns:
+        Neo4j driver
+    """
+    key = (uri, user, password)
+    driver = _DRIVERS.get(key)
+    if driver is None:
+        logger.info(f"Creating Neo4j driver for {uri}")
+        driver = GraphDatabase.driver(uri, auth=(user, password), **DRIVER_CONFIG)
+        _DRIVERS[key] = driver
+    return driver
+
+
+@atexit.register
+def _close_drivers():
+    """Close all shared drivers; registered to run at interpreter exit."""
+    while _DRIVERS:
+        _, driver = _DRIVERS.popitem()
+        driver.close()
+
+
+# Name of the GDS projection used by MinCutFinder
+PROJECTION_NAME = "min_cut_projection"
+
+# Path relationship lists longer than this are split by AsyncMinCutFinder into
+# chunks that are looked up concurrently; shorter lists go in one query
+MIN_CUT_BATCH_SIZE = 1000000
+
+# Collect the path relationships server-side; the aggregation always
+# yields exactly one row, even when no path is found
+_PATHS_QUERY = """
+CALL {
+    MATCH (start) WHERE elementId(start) = $start_id
+    MATCH (end) WHERE elementId(end) = $end_id
+    CALL apoc.path.expandConfig(start, {
+        relationshipFilter: $rel_pattern,
+        labelFilter: $label_pattern,
+        uniqueness: "RELATIONSHIP_GLOBAL",
+        maxLevel: $max_length,
+        terminatorNodes: [end]
+    })
+    YIELD path
+    UNWIND relationships(path) AS path_rel
+    RETURN count(DISTINCT path) AS path_count, collect(DISTINCT elementId(path_rel)) AS excluded_rel_ids
+}
+"""
+
+# Path finding alone, to check whether a kept projection still matches the graph
+_PATHS_ONLY_QUERY = _PATHS_QUERY + """
+RETURN path_count, excluded_rel_ids
+"""
+
+# failIfMissing=false: finders drop their projection name before building it,
+# and a missing projection is not worth a warning
+_DROP_QUERY = "CALL gds.graph.drop($projection_name, false)"
+
+# Token lookup indexes back the label and type scans in the projection query.
+# Neo4j creates them by default; connect() only reports missing ones, since an
+# administrator may have dropped them on purpose.
+_LOOKUP_INDEX_QUERY = """
+SHOW INDEXES YIELD type, entityType
+WHERE type = 'LOOKUP'
+RETURN collect(entityType) AS entity_types
+"""
+
+_ELEMENT_IDS_QUERY = """
+UNWIND $node_ids AS node_id
+MATCH (n) WHERE id(n) = node_id
+RETURN node_id, elementId(n) AS elementId
+"""
+
+
+def _ordered_element_ids(node_ids, cache):
+    """
+    Map node IDs to looked-up element IDs, in the order requested.
+    
+    Raises:
+        ValueError: If a node ID has no element ID (the node does not exist)
+    """
+    missing = [node_id for node_id in node_ids if node_id not in cache]
+    if missing:
+        raise ValueError(f"Nodes not found: {missing}")
+    return [cache[node_id] for node_id in node_ids]
+
+# Read the component IDs of the start and end nodes, then find the path
+# relationships that cross between components: each relationship is looked up
+# directly and its endpoints' component IDs are read once per row. {carry}
+# passes along columns of a preceding clause.
+_MIN_CUT_BODY = """
+OPTIONAL MATCH (s) WHERE elementId(s) = $start_id
+OPTIONAL MATCH (e) WHERE elementId(e) = $end_id
+WITH {carry}CASE WHEN s IS NULL THEN null ELSE gds.util.nodeProperty($projection_name, s, 'componentId') END AS start_component,
+     CASE WHEN e IS NULL THEN null ELSE gds.util.nodeProperty($projection_name, e, 'componentId') END AS end_component
+CALL {{
+    WITH start_component, end_component
+    UNWIND CASE
+        WHEN start_component IS NULL OR start_component = end_component THEN []
+        ELSE $rel_ids
+    END AS rel_id
+    MATCH ()-[r]->() WHERE elementId(r) = rel_id
+    WITH r, startNode(r) AS a, endNode(r) AS b, start_component
+    WITH r, a, b, start_component,
+         gds.util.nodeProperty($projection_name, a, 'componentId') AS source_component,
+         gds.util.nodeProperty($projection_name, b, 'componentId') AS target_component
+    WHERE source_component <> target_component
+    AND (source_component = start_component OR target_component = start_component)
+    RETURN collect([elementId(r), elementId(a), elementId(b), type(r)]) AS cut
+}}
+RETURN {carry}start_component, end_component, cut
+"""
+
+# Cut lookup on a projection whose components are already computed. It is
+# read-only, so it can use the parallel runtime; the query text is fixed, so it
+# is planned once and reused across calls.
+_MIN_CUT_QUERY = "CYPHER runtime=parallel" + _MIN_CUT_BODY.format(carry="")
+
+# WCC and the cut lookup in one query: the components are written to the
+# projection and read back by the cut lookup without a round-trip in between
+_WCC_MIN_CUT_QUERY = """
+CALL gds.wcc.mutate($projection_name, {
+    mutateProperty: 'componentId'
+})
+YIELD componentCount
+WITH componentCount
+""" + _MIN_CUT_BODY.format(carry="componentCount, ")
+
+# When the start node has no relationships left in the projection it forms a
+# component of its own, so the min-cut is exactly the path relationships
+# touching it and WCC is not needed
+_START_CUT_QUERY = """
+CYPHER runtime=parallel
+UNWIND $rel_ids AS rel_id
+MATCH ()-[r]->() WHERE elementId(r) = rel_id
+WITH r, startNode(r) AS a, endNode(r) AS b
+WHERE a <> b AND (elementId(a) = $start_id OR elementId(b) = $start_id)
+RETURN elementId(r) AS rel_id, elementId(a) AS source_id, elementId(b) AS target_id, type(r) AS rel_type
+"""
+_START_CUT_FIELDS = ("rel_id", "source_id", "target_id", "rel_type")
+
+
+def _check_component_count(component_count):
+    """
+    Check the number of components WCC found in the projection.
+    
+    Raises:
+        ValueError: If there is only one component
+    """
+    logger.info(f"WCC algorithm found {component_count} components")
+    if not component_count > 1:
+        logger.warning("WCC algorithm found only one component, no min-cut exists")
+        raise ValueError("No min-cut exists between the specified nodes")
+
+
+def _components_differ(record, start_node_id, end_node_id):
+    """
+    Check the start and end component IDs returned by the min-cut query.
+    
+    Returns:
+        True if the start and end nodes are in different components
+    
+    Raises:
+        ValueError: If the start or end node is not in the projection
+    """
+    start_component = record["start_component"]
+    end_component = record["end_component"]
+    
+    if start_component is None:
+        logger.error(f"Start node {start_node_id} not found in component mapping")
+        raise ValueError(f"Start node {start_node_id} not found in component mapping")
+    
+    if end_component is None:
+        logger.error(f"End node {end_node_id} not found in component mapping")
+        raise ValueError(f"End node {end_node_id} not found in component mapping")
+    
+    # If start and end are in the same component, there's no min-cut
+    if start_component == end_component:
+        logger.warning("Start and end nodes are in the same component, no min-cut exists")
+        return False
+    
+    logger.info(f"Start component: {start_component}, End component: {end_component}")
+    return True
+
+
+# Path finding and projection in one query. Besides the paths, it counts the
+# start node's relationships that survive into the projection (without any, the
+# start node is a component of its own), and isolates the projection MATCH in a
+# subquery so only (source, target) rows reach the projection aggregation.
+# APOC does not apply the label filter to the start node, so the second UNION
+# branch adds start and end nodes lacking the labels, with their relationships;
+# the branches never produce the same relationship, so UNION ALL is exact.
+# {node_filter} marks where the node label filter goes, {endpoint_labeled} the
+# label test that keeps the second branch from repeating labeled endpoints.
+_PROJECTION_QUERY_TEMPLATE = "cypher runtime=parallel" + _PATHS_QUERY + """
+CALL {
+    WITH excluded_rel_ids
+    OPTIONAL MATCH (s) WHERE elementId(s) = $start_id
+    OPTIONAL MATCH (s)-[r]-(o{node_filter})
+    WHERE o <> s
+    AND (size($rel_types) = 0 OR type(r) IN $rel_types)
+    AND NOT elementId(r) IN excluded_rel_ids
+    RETURN count(r) AS start_degree
+}
+CALL {
+    WITH excluded_rel_ids
+    MATCH (a{node_filter})
+    OPTIONAL MATCH (a)-[r]->(b{node_filter})
+    WHERE (size($rel_types) = 0 OR type(r) IN $rel_types)
+    AND NOT elementId(r) IN excluded_rel_ids
+    RETURN a AS source, b AS target
+    UNION ALL
+    WITH excluded_rel_ids
+    MATCH (a) WHERE elementId(a) IN [$start_id, $end_id] AND NOT ({endpoint_labeled})
+    OPTIONAL MATCH (a)-[r]-(b{node_filter})
+    WHERE (size($rel_types) = 0 OR type(r) IN $rel_types)
+    AND NOT elementId(r) IN excluded_rel_ids
+    RETURN a AS source, b AS target
+}
+WITH path_count, excluded_rel_ids, start_degree, gds.graph.project(
+    $projection_name,
+    source, 
+    target,
+    {},
+    {undirectedRelationshipTypes: ["*"]}
+)
+as g 
+RETURN g.graphName AS graph, g.nodeCount AS nodes, g.relationshipCount AS rels,
+       path_count, excluded_rel_ids, start_degree
+"""
+
+
+@lru_cache(maxsize=128)
+def _projection_query(node_labels):
+    """
+    Get the path finding and projection query for a tuple of node labels.
+    
+    Node labels cannot be parameters, so they go into the patterns as an escaped
+    disjunction (:`L1`|`L2`); the query text only changes with the label set,
+    and is built once per label set. Relationship types are filtered with a
+    parameter because the expansion starts from an already bound node anyway.
+    
+    Returns:
+        Query text
+    """
+    node_filter = ""
+    # Without labels every node is projected, endpoints included
+    endpoint_labeled = "true"
+    if node_labels:
+        node_filter = ":" + "|".join(
+            "`" + label.replace("`", "``") + "`" for label in node_labels
+        )
+        endpoint_labeled = "a" + node_filter
+    return (
+        _PROJECTION_QUERY_TEMPLATE
+        .replace("{node_filter}", node_filter)
+        .replace("{endpoint_labeled}", endpoint_labeled)
+    )
+
+
+def _build_projection_query(
+    start_node_id,
+    end_node_id,
+    relationship_types,
+    node_labels,
+    max_path_length,
+    projection_name
+):
+    """
+    Get the query that finds the paths and creates the projection without them,
+    with its parameters.
+    
+    Returns:
+        Tuple of the query text and its parameters
+    """
+    # Convert node labels to a list if it's a string
+    if isinstance(node_labels, str):
+        node_labels = [node_labels]
+    
+    # Convert relationship types to a list if it's a string
+    if isinstance(relationship_types, str):
+        relationship_types = [relationship_types]
+    
+    # Create relationship pattern for undirected traversal
+    # Format: REL1|REL2|...
+    rel_pattern = "|".join(relationship_types) if relationship_types else ""
+    
+    # Create node labels pattern
+    # Format: "LABEL1|LABEL2|..."
+    label_pattern = "|".join(node_labels) if node_labels else ""  # Empty means any node
+    
+    query = _projection_query(tuple(node_labels or ()))
+    params = {
+        "start_id": start_node_id,
+        "end_id": end_node_id,
+        "rel_pattern": rel_pattern,
+        "label_pattern": label_pattern,
+        "max_length": max_path_length,
+        "rel_types": list(relationship_types or []),
+        "projection_name": projection_name,
+    }
+    return query, params
+
+
+def _projection_key(start_node_id, end_node_id, relationship_types, node_labels, max_path_length):
+    """
+    Build the key identifying the inputs a projection was built from.
+    
+    Returns:
+        Hashable tuple; label and type order does not matter
+    """
+    if isinstance(node_labels, str):
+        node_labels = [node_labels]
+    if isinstance(relationship_types, str):
+        relationship_types = [relationship_types]
+    return (
+        start_node_id,
+        end_node_id,
+        tuple(sorted(relationship_types or [])),
+        tuple(sorted(node_labels or [])),
+        max_path_length,
+    )
+
+
+# (uri, database) pairs whose plugins and indexes have been checked in this
+# process, by MinCutFinder or AsyncMinCutFinder; connect() skips the checks for them
+_VERIFIED_DATABASES = set()
+
+# Plugin name and a query that fails when the plugin is missing
+_PLUGIN_CHECKS = (
+    ("APOC", "CALL apoc.help('path')"),
+    ("GDS", "CALL gds.list()"),
+)
+
+
+def _log_missing_lookup_indexes(entity_types):
+    """
+    Log the token lookup indexes missing from the result of _LOOKUP_INDEX_QUERY.
+    
+    Args:
+        entity_types: Entity types ("NODE", "RELATIONSHIP") that have a lookup index
+    """
+    for entity_type in ("NODE", "RELATIONSHIP"):
+        if entity_type not in entity_types:
+            logger.warning(
+                f"No {entity_type.lower()} token lookup index; projection scans will be slower"
+            )
+
+
+def _plugin_missing(name):
+    """
+    Log a missing plugin and build the error for connect() to raise.
+    
+    Returns:
+        RuntimeError naming the missing plugin
+    """
+    logger.error(f"{name} plugin is not available")
+    return RuntimeError(f"{name} plugin is required but not available")
+
+
+def _read_projection_record(record, projection_name):
+    """
+    Read the result of the path finding and projection query.
+    
+    Args:
+        record: The query's single record, or None if it returned no rows
+        projection_name: Name of the GDS projection that was created
+    
+    Returns:
+        Tuple of the list of relationship IDs in the paths and whether the
+        start node has no relationships left in the projection
+    """
+    if record is None:
+        # Neither a labeled node nor the endpoints exist: nothing to project
+        logger.info("No nodes matched the node labels, no projection created")
+        return [], False
+    path_relationships = record["excluded_rel_ids"]
+    logger.info(f"Found {record['path_count']} edge-disjoint paths with {len(path_relationships)} unique relationships")
+    logger.info(f"Created GDS projection: {projection_name} ({record['nodes']} nodes, {record['rels']} relationships)")
+    return path_relationships, record["start_degree"] == 0
+
+
+def _cut_relationships(rows):
+    """
+    Build the min-cut result from [rel_id, source_id, target_id, rel_type] rows.
+    
+    Returns:
+        List of relationship objects that form the min-cut
+    """
+    min_cut_relationships = [
+        {"id": rel_id, "source": source_id, "target": target_id, "type": rel_type}
+        for rel_id, source_id, target_id, rel_type in rows
+    ]
+    logger.info(f"Identified {len(min_cut_relationships)} relationships in the min-cut")
+    return min_cut_relationships
+
+
+def _no_clock():
+    """Stand-in for time.perf_counter when timing is disabled."""
+    return 0.0
+
+
+def _print_timing_summary(timing):
+    """
+    Print a summary of the execution times for each step of the min-cut algorithm.
+    
+    Args:
+        timing: Dictionary mapping step names to execution times in seconds
+    """
+    # Only print timing information if INFO logging is enabled for this module
+    if logger.isEnabledFor(logging.INFO):
+        total_time = timing.get('Total', 0)
+        if total_time == 0:
+            return
+            
+        print("\n=== Min-Cut Timing Summary ===")
+        print(f"{'Step':<30} {'Time (s)':<10} {'Percentage':<10}")
+        print("-" * 55)
+        
+        # Print each step's timing
+        for step, duration in timing.items():
+            if step != 'Total':
+                percentage = (duration / total_time) * 100
+                print(f"{step:<30} {duration:.4f}s    {percentage:.1f}%")
+        
+        # Print total at the end
+        print("-" * 55)
+        print(f"{'Total':<30} {total_time:.4f}s    100.0%\n")
+
 
 class MinCutFinder:
-    """Class for finding minimum cuts between nodes in a Neo4j graph."""
+    """
+    Class for finding minimum cuts between nodes in a Neo4j graph.
+    
+    Finders with the same connection parameters share one driver and its
+    connection pool, and an application's own driver can be passed in instead;
+    still, prefer reusing a single MinCutFinder for repeated find_min_cut calls,
+    since each instance verifies the connection.
+    """
     
-    def __init__(self, uri="bolt://localhost:7687", user="neo4j", password="password"):
+    def __init__(
+        self,
+        uri="bolt://localhost:7687",
+        user="neo4j",
+        password="password",
+        database=None,
+        driver=None,
+        caching=False
+    ):
         """
         Initialize the MinCutFinder with Neo4j connection parameters.
         
@@ -27,54 +497,99 @@ class MinCutFinder:
             uri: Neo4j connection URI
             user: Neo4j username
             password: Neo4j password
+            database: Name of the Neo4j database to run queries against;
+                None uses the user's home database
+            driver: Existing Neo4j driver to use instead of the shared one for
+                uri/user/password; the caller stays responsible for closing it
+            caching: Keep the GDS projection and the node element IDs between
+                calls (off by default). A kept projection is only rebuilt when
+                the inputs or the path set change, so changes to relationships
+                off the paths, or element IDs reused after a delete, go
+                unnoticed: call reset_projection_cache() after writing to the
+                graph. When False, the projection is dropped at the end of
+                every find_min_cut call and element IDs are looked up each time
         """
         self.uri = uri
         self.user = user
         self.password = password
+        self.database = database
         self.driver = None
+        self._external_driver = driver
+        # Node ID -> element ID; node IDs are only reused once a node is deleted
+        self._element_ids = {}
+        self._caching = caching
+        # Each finder owns its projection name, so finders never read or drop
+        # each other's projection
+        self._projection_name = f"{PROJECTION_NAME}_{uuid.uuid4().hex}"
+        # Inputs and path set of the projection kept from the last call
+        self._cached_projection = None
     
     def connect(self):
         """Establish connection to Neo4j database."""
         try:
-            self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
-            # Verify connection
-            with self.driver.session() as session:
-                result = session.run("RETURN 1 AS test")
-                result.single()["test"]
-            logger.info(f"Successfully connected to Neo4j at {self.uri}")
-            
-            # Verify APOC and GDS plugins
-            self._verify_plugins()
+            self.driver = self._external_driver or _get_driver(self.uri, self.user, self.password)
+            # The connection, plugin and index checks share one session
+            with self.driver.session(database=self.database) as session:
+                # Verify connection
+                session.run("RETURN 1 AS test").consume()
+                logger.info(f"Successfully connected to Neo4j at {self.uri}")
+                
+                if (self.uri, self.database) not in _VERIFIED_DATABASES:
+                    # Verify APOC and GDS plugins
+                    for name, query in _PLUGIN_CHECKS:
+                        try:
+                            session.run(query).consume()
+                        except Neo4jError:
+                            raise _plugin_missing(name)
+                        logger.info(f"{name} plugin is available")
+                    
+                    # Check the token lookup indexes; listing them may need a
+                    # privilege the user lacks, which is not worth a warning
+                    try:
+                        record = session.run(_LOOKUP_INDEX_QUERY).single()
+                        _log_missing_lookup_indexes(record["entity_types"])
+                    except Neo4jError as e:
+                        logger.info(f"Could not check lookup indexes: {str(e)}")
+                    
+                    _VERIFIED_DATABASES.add((self.uri, self.database))
             
             return True
         except Exception as e:
+            # Not connected, so close() has nothing to clean up on the server
+            self.driver = None
             logger.error(f"Failed to connect to Neo4j: {str(e)}")
             raise ConnectionError(f"Could not connect to Neo4j: {str(e)}")
     
-    def _verify_plugins(self):
-        """Verify that required Neo4j plugins (APOC and GDS) are installed."""
-        with self.driver.session() as session:
-            # Check APOC
-            try:
-                session.run("CALL apoc.help('path')")
-                logger.info("APOC plugin is available")
-            except Neo4jError:
-                logger.error("APOC plugin is not available")
-                raise RuntimeError("APOC plugin is required but not available")
-            
-            # Check GDS
-            try:
-                session.run("CALL gds.list()")
-                logger.info("GDS plugin is available")
-            except Neo4jError:
-                logger.error("GDS plugin is not available")
-                raise RuntimeError("GDS plugin is required but not available")
-    
     def close(self):
-        """Close the Neo4j connection."""
+        """
+        Release this finder's Neo4j connection.
+        
+        The driver is shared with other finders using the same connection
+        parameters, so it stays open and is closed at interpreter exit.
+        """
         if self.driver:
-            self.driver.close()
-            logger.info("Neo4j connection closed")
+            self.reset_projection_cache()
+            self.driver = None
+            logger.info("Neo4j connection released")
+        self._element_ids.clear()
+    
+    def reset_projection_cache(self):
+        """
+        Drop the GDS projection kept from the last find_min_cut call, and
+        forget the cached node element IDs.
+        
+        The projection is reused while the inputs and the path set stay the
+        same, so call this after changing relationships off those paths to make
+        the next call see the changes.
+        """
+        # Node IDs of deleted nodes are reused, so the element IDs go too
+        self._element_ids.clear()
+        self._cached_projection = None
+        # Dropped even when nothing is tracked, since a call that failed
+        # before tracking its projection may have left it behind
+        if self.driver:
+            with self.driver.session(database=self.database) as session:
+                self._drop_gds_projection(session, self._projection_name)
     
     def find_min_cut(
         self,
@@ -87,11 +602,17 @@ class MinCutFinder:
         """
         Find the minimum cut between start and end nodes in an undirected graph.
         
+        With caching=True, the GDS projection is kept after the call. A
+        repeated call with the same inputs still finds the paths, but when they
+        are unchanged it reuses the projection and skips projection and WCC.
+        The result can then be stale: call reset_projection_cache() after
+        changing the graph.
+        
         Args:
             start_node_id: ID of the start node
             end_node_id: ID of the end node
-            relationship_types: List of relationship types to traverse
-            node_labels: List of node labels to consider
+            relationship_types: Sequence (list or tuple) of relationship types to traverse
+            node_labels: Sequence (list or tuple) of node labels to consider
             max_path_length: Maximum path length to consider
             
         Returns:
@@ -100,64 +621,115 @@ class MinCutFinder:
         if not self.driver:
             self.connect()
         
-        # Dictionary to store timing information
+        # Dictionary to store timing information; the clock is only read when
+        # the summary will actually be printed
         timing = {}
-        start_time_total = time.time()
+        clock = time.perf_counter if logger.isEnabledFor(logging.INFO) else _no_clock
+        start_time_total = clock()
         
         try:
             start_node_id = start_node_id.strip()
             end_node_id = end_node_id.strip()
             
-            # Step 1: Find edge-disjoint paths
-            start_time = time.time()
-            paths = self._find_edge_disjoint_paths(
-                start_node_id, 
-                end_node_id, 
-                relationship_types, 
-                node_labels, 
-                max_path_length
+            key = _projection_key(
+                start_node_id, end_node_id, relationship_types, node_labels, max_path_length
             )
-            timing['1. Find edge-disjoint paths'] = time.time() - start_time
-            
-            if not paths:
-                logger.warning("No paths found between start and end nodes")
-                return []
+            cached = self._cached_projection
+            # Cleared until this call succeeds, so a failed call never leaves a
+            # half-built projection behind for the next one to reuse
+            self._cached_projection = None
             
-            # Step 2: Extract all relationships from paths
-            start_time = time.time()
-            path_relationships = self._extract_relationships_from_paths(paths)
-            timing['2. Extract relationships'] = time.time() - start_time
-            
-            # Step 3: Create GDS projection with path relationships removed
-            start_time = time.time()
-            projection_name = self._create_gds_projection_without_paths(
-                path_relationships, 
-                relationship_types, 
-                node_labels
-            )
-            timing['3. Create GDS projection'] = time.time() - start_time
-            
-            # Step 4: Run WCC algorithm
-            start_time = time.time()
-            self._run_wcc_algorithm(projection_name)
-            timing['4. Run WCC algorithm'] = time.time() - start_time
-            
-            # Step 5: Identify min-cut relationships
-            start_time = time.time()
-            min_cut = self._identify_min_cut_relationships(
-                 path_relationships, 
-                start_node_id, 
-                end_node_id
-            )
-            timing['5. Identify min-cut'] = time.time() - start_time
+            # All steps share one session, so the whole pipeline runs on a
+            # single pooled connection
+            with self.driver.session(database=self.database) as session:
+                reuse = False
+                if cached is not None and cached["key"] == key:
+                    # Same inputs as the previous call: the projection, its
+                    # components and the start node check are still valid as
+                    # long as the paths did not change
+                    start_time = clock()
+                    try:
+                        path_relationships = self._find_path_relationships(
+                            session,
+                            start_node_id,
+                            end_node_id,
+                            relationship_types,
+                            node_labels,
+                            max_path_length
+                        )
+                    except Exception:
+                        # The kept projection is no longer tracked
+                        self._drop_gds_projection(session, self._projection_name)
+                        raise
+                    timing['1. Find paths'] = clock() - start_time
+                    reuse = frozenset(path_relationships) == cached["path_set"]
+                
+                if reuse:
+                    logger.info(f"Reusing GDS projection: {self._projection_name}")
+                    start_isolated = cached["start_isolated"]
+                else:
+                    # Step 1: Find edge-disjoint paths and create the GDS projection
+                    # without their relationships, in a single query
+                    start_time = clock()
+                    path_relationships, start_isolated = self._create_gds_projection_without_paths(
+                        session,
+                        start_node_id, 
+                        end_node_id, 
+                        relationship_types, 
+                        node_labels, 
+                        max_path_length
+                    )
+                    timing['1. Find paths + project'] = clock() - start_time
+                    
+                    if not path_relationships:
+                        logger.warning("No paths found between start and end nodes")
+                        self._drop_gds_projection(session, self._projection_name)
+                        return []
+                
+                try:
+                    # Step 2: Identify min-cut relationships. A new projection gets
+                    # its components from WCC in the same query; that is not
+                    # needed when the start node is a component of its own.
+                    start_time = clock()
+                    if start_isolated:
+                        min_cut = self._identify_start_cut_relationships(
+                            session,
+                            path_relationships,
+                            start_node_id
+                        )
+                    else:
+                        min_cut = self._identify_min_cut_relationships(
+                            session,
+                            path_relationships, 
+                            start_node_id, 
+                            end_node_id,
+                            self._projection_name,
+                            run_wcc=not reuse
+                        )
+                    timing['2. Run WCC + identify min-cut'] = clock() - start_time
+                except Exception:
+                    # Never leave a projection behind that is not tracked as cached
+                    self._drop_gds_projection(session, self._projection_name)
+                    raise
+                
+                if not self._caching:
+                    # Step 3: Clean up GDS projection
+                    start_time = clock()
+                    self._drop_gds_projection(session, self._projection_name)
+                    timing['3. Drop GDS projection'] = clock() - start_time
             
-            # Step 6: Clean up GDS projection
-            start_time = time.time()
-            self._drop_gds_projection(projection_name)
-            timing['6. Drop GDS projection'] = time.time() - start_time
+            if self._caching:
+                # Keep the projection for the next call; it is rebuilt when
+                # the inputs or paths change, and dropped by
+                # reset_projection_cache() or close()
+                self._cached_projection = {
+                    "key": key,
+                    "path_set": frozenset(path_relationships),
+                    "start_isolated": start_isolated,
+                }
             
             # Calculate total time
-            timing['Total'] = time.time() - start_time_total
+            timing['Total'] = clock() - start_time_total
             
             # Print timing summary if logging is enabled
             self._print_timing_summary(timing)
@@ -168,8 +740,9 @@ class MinCutFinder:
             logger.error(f"Error finding min-cut: {str(e)}")
             raise
     
-    def _find_edge_disjoint_paths(
+    def _create_gds_projection_without_paths(
         self, 
+        session,
         start_node_id, 
         end_node_id, 
         relationship_types, 
@@ -177,221 +750,433 @@ class MinCutFinder:
         max_path_length
     ):
         """
-        Find all edge-disjoint paths between start and end nodes using APOC.
+        Find all edge-disjoint paths between start and end nodes using APOC and create
+        a GDS graph projection without the relationships in those paths using Cypher
+        projection.
+        
+        Both steps run server-side in one query: the path relationship IDs are
+        collected in a subquery and excluded from the projection directly, so the
+        paths themselves are never sent to the client.
         
         Returns:
-            List of paths, where each path is a list of nodes and relationships
+            Tuple of the list of relationship IDs in the paths and whether the
+            start node has no relationships left in the projection
         """
         logger.info(f"Finding edge-disjoint paths from node {start_node_id} to {end_node_id}")
         
-        # Create relationship pattern for undirected traversal
-        # Format: REL1|REL2|...
-        rel_pattern = ""
-        if relationship_types:
-            rel_pattern = "|".join(relationship_types) #Do we need to exclude start and end nodes?
-        else:
-            rel_pattern = ""
-        # Any relationship in any direction
-        
-        # Create node labels pattern
-        # Format: "LABEL1|LABEL2|..."
-        label_pattern = ""
-        if node_labels:
-            label_pattern = "|".join(node_labels)
-        else:
-            label_pattern = ""  # Any node
-    
-        with self.driver.session() as session:
-            query = """
-            MATCH (start) WHERE elementId(start) = $start_id
-            MATCH (end) WHERE elementId(end) = $end_id
-            CALL apoc.path.expandConfig(start, {
-                relationshipFilter: $rel_pattern,
-                labelFilter: $label_pattern,
-                uniqueness: "RELATIONSHIP_GLOBAL",
-                maxLevel: $max_length,
-                terminatorNodes: [end]
-            })
-            YIELD path
-            RETURN path
-            """            
-            result = session.run(
-                query,
-                start_id=start_node_id,
-                end_id=end_node_id,
-                rel_pattern=rel_pattern,
-                label_pattern=label_pattern,
-                max_length=max_path_length
-            )
-            
-            paths = [record["path"] for record in result]
-            logger.info(f"Found {len(paths)} edge-disjoint paths")
-            
-            return paths
+        projection_name = self._projection_name
+        
+        self._drop_gds_projection(session, projection_name)  # Ensure clean state before creating projection
+
+        query, params = _build_projection_query(
+            start_node_id,
+            end_node_id,
+            relationship_types,
+            node_labels,
+            max_path_length,
+            projection_name
+        )
+        result = session.run(query, **params)
+        return _read_projection_record(result.single(), projection_name)
     
-    def _extract_relationships_from_paths(self, paths):
+    def _find_path_relationships(
+        self,
+        session,
+        start_node_id,
+        end_node_id,
+        relationship_types,
+        node_labels,
+        max_path_length
+    ):
         """
-        Extract all relationships from the given paths.
+        Find the edge-disjoint paths between start and end nodes without
+        projecting, to check whether a kept projection still matches them.
         
         Returns:
-            Set of relationship IDs
+            List of relationship IDs in the paths
+        """
+        logger.info(f"Finding edge-disjoint paths from node {start_node_id} to {end_node_id}")
+        
+        _, params = _build_projection_query(
+            start_node_id,
+            end_node_id,
+            relationship_types,
+            node_labels,
+            max_path_length,
+            self._projection_name
+        )
+        r = session.run(_PATHS_ONLY_QUERY, **params).single()
+        path_relationships = r["excluded_rel_ids"]
+        logger.info(f"Found {r['path_count']} edge-disjoint paths with {len(path_relationships)} unique relationships")
+        return path_relationships
+    
+    def _drop_gds_projection(self, session, projection_name):
+        """
+        Drop the GDS graph projection when it's no longer needed.
+        
+        Args:
+            session: Open session to run the query in
+            projection_name: Name of the GDS projection to drop
+        """
+        logger.info(f"Dropping GDS projection: {projection_name}")
+        
+        try:
+            # Consume here so a failure surfaces (and is handled) now rather
+            # than in the next query run on the shared session
+            session.run(_DROP_QUERY, projection_name=projection_name).consume()
+            logger.info(f"Successfully dropped GDS projection: {projection_name}")
+        except Neo4jError as e:
+            logger.warning(f"Failed to drop GDS projection '{projection_name}': {str(e)}")
+    
+    def _print_timing_summary(self, timing):
         """
-        relationship_ids = set()
+        Print a summary of the execution times for each step of the min-cut algorithm.
         
-        for path in paths:
-            for rel in path.relationships:
-                relationship_ids.add(rel.element_id)
+        Args:
+            timing: Dictionary mapping step names to execution times in seconds
+        """
+        _print_timing_summary(timing)
+    
+    def get_element_id_from_id(self, node_id):
+        """
+        Get the element ID for a given node ID.
         
-        logger.info(f"Extracted {len(relationship_ids)} unique relationships from paths")
-        return relationship_ids
+        Args:
+            node_id: ID of the node to query
+            
+        Returns:
+            Element ID of the node
+        """
+        return self.get_element_ids_from_ids([node_id])[0]
     
-    def get_node_condition(self, variable:str, node_labels:list):
-        return ' OR '.join([f'{variable}:{label}' for label in node_labels])
+    def get_element_ids_from_ids(self, node_ids):
+        """
+        Get the element IDs for several node IDs with a single query.
+        
+        With caching=True, results are kept on the finder until
+        reset_projection_cache() or close(), so only IDs not looked up before
+        are sent to the database.
+        
+        Args:
+            node_ids: IDs of the nodes to query
+            
+        Returns:
+            List of element IDs, in the order of node_ids
+        
+        Raises:
+            ValueError: If a node does not exist
+        """
+        cache = self._element_ids if self._caching else {}
+        to_fetch = list({node_id for node_id in node_ids if node_id not in cache})
+        if to_fetch:
+            if not self.driver:
+                self.connect()
+            # A standalone read, so let the driver manage the session and
+            # route it to any reader
+            records, _, _ = self.driver.execute_query(
+                _ELEMENT_IDS_QUERY,
+                node_ids=to_fetch,
+                database_=self.database,
+                routing_=RoutingControl.READ
+            )
+            cache.update((r["node_id"], r["elementId"]) for r in records)
+        return _ordered_element_ids(node_ids, cache)
 
+    def _identify_start_cut_relationships(self, session, path_relationships, start_node_id):
+        """
+        Identify the min-cut when the start node has no relationships left in the
+        projection: the cut is then the path relationships touching the start node.
+        
+        Returns:
+            List of relationship objects that form the min-cut
+        """
+        logger.info("Start node is isolated in the projection, skipping WCC")
+        
+        result = session.run(
+            _START_CUT_QUERY,
+            rel_ids=path_relationships,
+            start_id=start_node_id
+        )
+        return _cut_relationships(result.values(*_START_CUT_FIELDS))
 
-    def _create_gds_projection_without_paths(
+    def _identify_min_cut_relationships(
         self, 
+        session,
         path_relationships, 
-        relationship_types, 
-        node_labels
+        start_node_id, 
+        end_node_id, 
+        projection_name,
+        run_wcc=True
     ):
         """
-        Create a GDS graph projection without the relationships in the paths using Cypher projection.
+        Identify relationships in the original paths that form the min-cut.
+        Uses the componentId property stored in the graph directly when possible.
+        
+        Args:
+            run_wcc: Compute the components with WCC (mutate mode) in the same
+                query first; pass False when the projection already has them
         
         Returns:
-            Name of the created GDS projection
+            List of relationship objects that form the min-cut
+        
+        Raises:
+            ValueError: If WCC finds only one component
         """
-        projection_name = "min_cut_projection"
+        logger.info("Identifying min-cut relationships")
+        if run_wcc:
+            logger.info(f"Running WCC algorithm on projection: {projection_name}")
         
-        # Convert node labels to a list if it's a string
-        if isinstance(node_labels, str):
-            node_labels = [node_labels]
+        # All IDs (element ID strings, matched with elementId(r)) go in a single
+        # list parameter; its size is not limited by the query text, so one
+        # round-trip covers the whole path set
+        record = session.run(
+            _WCC_MIN_CUT_QUERY if run_wcc else _MIN_CUT_QUERY, 
+            rel_ids=path_relationships,
+            start_id=start_node_id,
+            end_id=end_node_id,
+            projection_name=projection_name
+        ).single()
+        if run_wcc:
+            _check_component_count(record["componentCount"])
+        if not _components_differ(record, start_node_id, end_node_id):
+            return []
         
-        # Convert relationship types to a list if it's a string
-        if isinstance(relationship_types, str):
-            relationship_types = [relationship_types]
-        self._drop_gds_projection(projection_name)  # Ensure clean state before creating projection
-        with self.driver.session() as session:
+        # Relationships that cross between components
+        return _cut_relationships(record["cut"])
 
-            # Convert path relationships to a list and ensure they are integers
-            path_rel_list = [rel_id for rel_id in path_relationships] if path_relationships else []
-            
-            rel_conditions = []
-            if relationship_types:
-                for rel_type in relationship_types:
-                    rel_conditions.append(f"type(r) = '{rel_type}'")
-                rel_type_condition = " OR ".join(rel_conditions) if rel_conditions else "true"
-            # Build relationship query that excludes the path relationships
-           
-            project_query = f"""
-            MATCH (a) 
-            OPTIONAL MATCH (a)-[r]->(b)
-            WHERE ({self.get_node_condition('a', node_labels)}) AND ({self.get_node_condition('b', node_labels)}) AND ({rel_type_condition})
-            AND NOT elementId(r) IN $excluded_rel_ids
-            WITH a AS source, b as target, type(r) AS type
-            """
-            query = f"""
-            cypher runtime=parallel
-            {project_query}
-            WITH gds.graph.project(
-                '{projection_name}',
-                source, 
-                target,
-                {{}},
-                {{undirectedRelationshipTypes: ["*"]}}
-            )
-            as g 
-            RETURN g.graphName AS graph, g.nodeCount AS nodes, g.relationshipCount AS rels
-            """
 
-            result = session.run(
-                query,
-                projection_name=projection_name,
-                excluded_rel_ids=path_rel_list
+class AsyncMinCutFinder:
+    """
+    Asynchronous variant of MinCutFinder built on the async Neo4j driver.
+    
+    Concurrent find_min_cut calls on one instance share its driver and connection
+    pool, so their round-trips overlap instead of running one after another. Each
+    call works on its own uniquely named GDS projection, which makes concurrent
+    calls safe.
+    
+    Example:
+        async with AsyncMinCutFinder(uri, user, password) as finder:
+            cuts = await asyncio.gather(
+                *(finder.find_min_cut(s, e, rel_types, labels) for s, e in pairs)
             )
-            r = result.single()
-            logger.info(r.values())
-            logger.info(f"Created GDS projection: {projection_name}")
+    """
+    
+    def __init__(self, uri="bolt://localhost:7687", user="neo4j", password="password", database=None):
+        """
+        Initialize the AsyncMinCutFinder with Neo4j connection parameters.
+        
+        Args:
+            uri: Neo4j connection URI
+            user: Neo4j username
+            password: Neo4j password
+            database: Name of the Neo4j database to run queries against;
+                None uses the user's home database
+        """
+        self.uri = uri
+        self.user = user
+        self.password = password
+        self.database = database
+        self.driver = None
+        self._connect_lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def connect(self):
+        """Establish connection to Neo4j database."""
+        try:
+            self.driver = AsyncGraphDatabase.driver(
+                self.uri, auth=(self.user, self.password), **DRIVER_CONFIG
+            )
+            # The connection, plugin and index checks share one session
+            async with self.driver.session(database=self.database) as session:
+                # Verify connection
+                await (await session.run("RETURN 1 AS test")).consume()
+                logger.info(f"Successfully connected to Neo4j at {self.uri}")
+                
+                if (self.uri, self.database) not in _VERIFIED_DATABASES:
+                    # Verify APOC and GDS plugins
+                    for name, query in _PLUGIN_CHECKS:
+                        try:
+                            await (await session.run(query)).consume()
+                        except Neo4jError:
+                            raise _plugin_missing(name)
+                        logger.info(f"{name} plugin is available")
+                    
+                    # Check the token lookup indexes; listing them may need a
+                    # privilege the user lacks, which is not worth a warning
+                    try:
+                        record = await (await session.run(_LOOKUP_INDEX_QUERY)).single()
+                        _log_missing_lookup_indexes(record["entity_types"])
+                    except Neo4jError as e:
+                        logger.info(f"Could not check lookup indexes: {str(e)}")
+                    
+                    _VERIFIED_DATABASES.add((self.uri, self.database))
             
-            return projection_name
+            return True
+        except Exception as e:
+            logger.error(f"Failed to connect to Neo4j: {str(e)}")
+            raise ConnectionError(f"Could not connect to Neo4j: {str(e)}")
     
-    def _run_wcc_algorithm(self, projection_name):
+    async def close(self):
+        """Close the Neo4j connection."""
+        if self.driver:
+            await self.driver.close()
+            self.driver = None
+            logger.info("Neo4j connection closed")
+    
+    async def _ensure_connected(self):
+        """Connect on first use; concurrent callers wait for a single connect."""
+        async with self._connect_lock:
+            if not self.driver:
+                await self.connect()
+    
+    async def find_min_cut(
+        self,
+        start_node_id,
+        end_node_id,
+        relationship_types,
+        node_labels,
+        max_path_length=10
+    ):
         """
-        Run the Weakly Connected Components algorithm on the GDS projection using mutate mode.
-        This is more efficient for large graphs as it doesn't require storing the entire
-        component mapping in memory.
+        Find the minimum cut between start and end nodes in an undirected graph.
         
+        Args:
+            start_node_id: ID of the start node
+            end_node_id: ID of the end node
+            relationship_types: Sequence (list or tuple) of relationship types to traverse
+            node_labels: Sequence (list or tuple) of node labels to consider
+            max_path_length: Maximum path length to consider
+            
         Returns:
-            Dictionary mapping node IDs to their component IDs for compatibility
+            List of relationship IDs that form the minimum cut
         """
-        logger.info(f"Running WCC algorithm on projection: {projection_name}")
+        await self._ensure_connected()
+        
+        # Dictionary to store timing information; the clock is only read when
+        # the summary will actually be printed
+        timing = {}
+        clock = time.perf_counter if logger.isEnabledFor(logging.INFO) else _no_clock
+        start_time_total = clock()
         
-        with self.driver.session() as session:
-            query = """
-            CALL gds.wcc.mutate($projection_name, {
-                mutateProperty: 'componentId'
-            })
-            YIELD componentCount
-            RETURN componentCount
-            """
+        # A unique name per call keeps concurrent calls from sharing a projection
+        projection_name = f"{PROJECTION_NAME}_{uuid.uuid4().hex}"
+        
+        try:
+            start_node_id = start_node_id.strip()
+            end_node_id = end_node_id.strip()
+            
+            async with self.driver.session(database=self.database) as session:
+                try:
+                    # Step 1: Find edge-disjoint paths and create the GDS projection
+                    # without their relationships, in a single query
+                    start_time = clock()
+                    path_relationships, start_isolated = await self._create_gds_projection_without_paths(
+                        session,
+                        projection_name,
+                        start_node_id,
+                        end_node_id,
+                        relationship_types,
+                        node_labels,
+                        max_path_length
+                    )
+                    timing['1. Find paths + project'] = clock() - start_time
+                    
+                    if not path_relationships:
+                        logger.warning("No paths found between start and end nodes")
+                        return []
+                    
+                    # Step 2: Run WCC and identify min-cut relationships in one
+                    # query; WCC is not needed when the start node is a
+                    # component of its own
+                    start_time = clock()
+                    if start_isolated:
+                        min_cut = await self._identify_start_cut_relationships(
+                            session,
+                            path_relationships,
+                            start_node_id
+                        )
+                    else:
+                        min_cut = await self._identify_min_cut_relationships(
+                            session,
+                            path_relationships,
+                            start_node_id,
+                            end_node_id,
+                            projection_name
+                        )
+                    timing['2. Run WCC + identify min-cut'] = clock() - start_time
+                finally:
+                    # Step 3: Clean up GDS projection
+                    start_time = clock()
+                    await self._drop_gds_projection(session, projection_name)
+                    timing['3. Drop GDS projection'] = clock() - start_time
+            
+            # Calculate total time
+            timing['Total'] = clock() - start_time_total
             
-            result = session.run(query, projection_name=projection_name)
-            component_count = result.single()["componentCount"]
-            logger.info(f"WCC algorithm found {component_count} components")
-            if not component_count > 1:
-                logger.warning("WCC algorithm found only one component, no min-cut exists")
-                raise ValueError("No min-cut exists between the specified nodes")
-
-            print(f"WCC algorithm found {component_count} components")
+            # Print timing summary if logging is enabled
+            _print_timing_summary(timing)
+            
+            return min_cut
             
-           
+        except Exception as e:
+            logger.error(f"Error finding min-cut: {str(e)}")
+            raise
     
-    def _drop_gds_projection(self, projection_name):
+    async def _create_gds_projection_without_paths(
+        self,
+        session,
+        projection_name,
+        start_node_id,
+        end_node_id,
+        relationship_types,
+        node_labels,
+        max_path_length
+    ):
         """
-        Drop the GDS graph projection when it's no longer needed.
+        Find all edge-disjoint paths between start and end nodes and create a GDS
+        graph projection without the relationships in those paths, in one query.
         
-        Args:
-            projection_name: Name of the GDS projection to drop
+        Returns:
+            Tuple of the list of relationship IDs in the paths and whether the
+            start node has no relationships left in the projection
         """
-        logger.info(f"Dropping GDS projection: {projection_name}")
+        logger.info(f"Finding edge-disjoint paths from node {start_node_id} to {end_node_id}")
         
-        with self.driver.session() as session:
-            try:
-                # Updated to use the current GDS API without deprecated parameters
-                query = "CALL gds.graph.drop($projection_name)"
-                session.run(query, projection_name=projection_name)
-                logger.info(f"Successfully dropped GDS projection: {projection_name}")
-            except Neo4jError as e:
-                logger.warning(f"Failed to drop GDS projection '{projection_name}': {str(e)}")
+        query, params = _build_projection_query(
+            start_node_id,
+            end_node_id,
+            relationship_types,
+            node_labels,
+            max_path_length,
+            projection_name
+        )
+        result = await session.run(query, **params)
+        return _read_projection_record(await result.single(), projection_name)
     
-    def _print_timing_summary(self, timing):
+    async def _drop_gds_projection(self, session, projection_name):
         """
-        Print a summary of the execution times for each step of the min-cut algorithm.
+        Drop the GDS graph projection when it's no longer needed.
         
         Args:
-            timing: Dictionary mapping step names to execution times in seconds
+            session: Open session to run the query in
+            projection_name: Name of the GDS projection to drop
         """
-        # Only print timing information if logging is enabled at INFO level or lower
-        if logger.level <= logging.INFO:
-            total_time = timing.get('Total', 0)
-            if total_time == 0:
-                return
-                
-            print("\n=== Min-Cut Timing Summary ===")
-            print(f"{'Step':<30} {'Time (s)':<10} {'Percentage':<10}")
-            print("-" * 55)
-            
-            # Print each step's timing
-            for step, duration in timing.items():
-                if step != 'Total':
-                    percentage = (duration / total_time) * 100
-                    print(f"{step:<30} {duration:.4f}s    {percentage:.1f}%")
-            
-            # Print total at the end
-            print("-" * 55)
-            print(f"{'Total':<30} {total_time:.4f}s    100.0%\n")
+        logger.info(f"Dropping GDS projection: {projection_name}")
+        
+        try:
+            result = await session.run(_DROP_QUERY, projection_name=projection_name)
+            await result.consume()
+            logger.info(f"Successfully dropped GDS projection: {projection_name}")
+        except Neo4jError as e:
+            logger.warning(f"Failed to drop GDS projection '{projection_name}': {str(e)}")
     
-    def get_element_id_from_id(self, node_id):
+    async def get_element_id_from_id(self, node_id):
         """
         Get the element ID for a given node ID.
         
@@ -401,103 +1186,125 @@ class MinCutFinder:
         Returns:
             Element ID of the node
         """
-        if not self.driver:
-            self.connect()
-        with self.driver.session() as session:
-            query = "MATCH (n) WHERE id(n) = $node_id RETURN elementId(n) AS elementId"
-            result = session.run(query, node_id=node_id)
-            return result.single()["elementId"]
-
-    def _get_component_id(self, node_id, projection_name):
+        return (await self.get_element_ids_from_ids([node_id]))[0]
+    
+    async def get_element_ids_from_ids(self, node_ids):
         """
-        Get the component ID for a given node in the GDS projection.
+        Get the element IDs for several node IDs with a single query.
+        
+        Unlike MinCutFinder with caching=True, results are not kept: node IDs
+        are reused once a node is deleted, and concurrent callers of an async
+        finder have no point at which to reset a cache.
         
         Args:
-            node_id: ID of the node to query
-            projection_name: Name of the GDS projection
+            node_ids: IDs of the nodes to query
             
         Returns:
-            Component ID for the node
+            List of element IDs, in the order of node_ids
+        
+        Raises:
+            ValueError: If a node does not exist
         """
-        with self.driver.session() as session:
-            query = """
-            match (n) where elementId(n) = $node_id
-            RETURN gds.util.nodeProperty($projection_name, n, 'componentId') AS componentId
-            """
-            result = session.run(query, projection_name=projection_name, node_id=node_id)
-            return result.single()["componentId"]
-
-    def _identify_min_cut_relationships(
-        self, 
-        path_relationships, 
-        start_node_id, 
-        end_node_id, 
-        projection_name="min_cut_projection"
+        await self._ensure_connected()
+        # A standalone read, so let the driver manage the session and
+        # route it to any reader
+        records, _, _ = await self.driver.execute_query(
+            _ELEMENT_IDS_QUERY,
+            node_ids=list(set(node_ids)),
+            database_=self.database,
+            routing_=RoutingControl.READ
+        )
+        element_ids = {r["node_id"]: r["elementId"] for r in records}
+        return _ordered_element_ids(node_ids, element_ids)
+    
+    async def _identify_start_cut_relationships(self, session, path_relationships, start_node_id):
+        """
+        Identify the min-cut when the start node has no relationships left in the
+        projection: the cut is then the path relationships touching the start node.
+        
+        Returns:
+            List of relationship objects that form the min-cut
+        """
+        logger.info("Start node is isolated in the projection, skipping WCC")
+        
+        result = await session.run(
+            _START_CUT_QUERY,
+            rel_ids=path_relationships,
+            start_id=start_node_id
+        )
+        return _cut_relationships(await result.values(*_START_CUT_FIELDS))
+    
+    async def _identify_min_cut_relationships(
+        self,
+        session,
+        path_relationships,
+        start_node_id,
+        end_node_id,
+        projection_name
     ):
         """
-        Identify relationships in the original paths that form the min-cut.
-        Uses the componentId property stored in the graph directly when possible.
+        Run WCC on the projection and identify relationships in the original
+        paths that form the min-cut.
+        
+        WCC runs in the same query as the lookup of the first chunk. Very large
+        path sets (more than MIN_CUT_BATCH_SIZE relationships) are split into
+        chunks, and the remaining chunks run concurrently, each on its own session.
         
         Returns:
             List of relationship objects that form the min-cut
+        
+        Raises:
+            ValueError: If WCC finds only one component
         """
         logger.info("Identifying min-cut relationships")
+        logger.info(f"Running WCC algorithm on projection: {projection_name}")
         
-        # Find relationships that cross between components
-        min_cut_relationships = []
-        start_component = self._get_component_id(start_node_id, projection_name)
-        end_component = self._get_component_id(end_node_id, projection_name)
+        async def run_batch(batch_session, query, batch):
+            result = await batch_session.run(
+                query,
+                rel_ids=batch,
+                start_id=start_node_id,
+                end_id=end_node_id,
+                projection_name=projection_name
+            )
+            return await result.single()
+        
+        async def run_batch_in_new_session(batch):
+            async with self.driver.session(database=self.database) as batch_session:
+                return await run_batch(batch_session, _MIN_CUT_QUERY, batch)
+        
+        batches = [
+            path_relationships[i:i + MIN_CUT_BATCH_SIZE]
+            for i in range(0, len(path_relationships), MIN_CUT_BATCH_SIZE)
+        ]
+        # The first chunk computes the components the other chunks read
+        first = await run_batch(session, _WCC_MIN_CUT_QUERY, batches[0])
+        _check_component_count(first["componentCount"])
+        if not _components_differ(first, start_node_id, end_node_id):
+            return []
+        records = [first]
+        records.extend(await asyncio.gather(*(run_batch_in_new_session(batch) for batch in batches[1:])))
+        
+        return _cut_relationships(row for record in records for row in record["cut"])
 
-        if start_component is None:
-            logger.error(f"Start node {start_node_id} not found in component mapping")
-            raise ValueError(f"Start node {start_node_id} not found in component mapping")
-    
-        if end_component is None:
-            logger.error(f"End node {end_node_id} not found in component mapping")
-            raise ValueError(f"End node {end_node_id} not found in component mapping")
+
+@lru_cache(maxsize=None)
+def _get_finder(uri, user, password, database):
+    """
+    Get the process-wide MinCutFinder used by the module-level find_min_cut.
     
-        # If start and end are in the same component, there's no min-cut
-        if start_component == end_component:
-            logger.warning("Start and end nodes are in the same component, no min-cut exists")
-            return []
+    The finder connects (and verifies the plugins) once on first use and is
+    released at interpreter exit. It keeps no projection or element IDs between
+    calls, since callers of find_min_cut cannot reset them after changing the
+    graph.
     
-        with self.driver.session() as session:
-            logger.info(f"Start component: {start_component}, End component: {end_component}")
+    Returns:
+        MinCutFinder for the given connection parameters
+    """
+    finder = MinCutFinder(uri, user, password, database=database)
+    atexit.register(finder.close)
+    return finder
 
-            # Convert relationship IDs to integers for consistency
-            path_rel_list = [rel_id for rel_id in path_relationships]
-            
-            # Find edges that cross between components more efficiently
-            # by directly querying the projection's component IDs
-            query = f"""
-            MATCH (a)-[r]->(b) 
-            WHERE elementId(r) IN $rel_ids AND
-            gds.util.nodeProperty('{projection_name}', a, 'componentId') <> gds.util.nodeProperty('{projection_name}', b, 'componentId')
-            AND
-            (gds.util.nodeProperty('{projection_name}', a, 'componentId') = $start_component OR
-            gds.util.nodeProperty('{projection_name}', b, 'componentId') = $start_component)
-            
-            RETURN elementId(r) as rel, elementId(a) as source, elementId(b) as target
-            """
-            # We need to batch large lists to avoid query size limits
-            batch_size = 1000
-            for i in range(0, len(path_rel_list), batch_size):
-                batch = path_rel_list[i:i+batch_size]
-                
-                result = session.run(
-                    query, 
-                    rel_ids=batch,
-                    start_component=start_component,
-                    end_component=end_component
-                )
-                
-                for record in result:
-                    min_cut_relationships.append({
-                        "id": record["rel"],
-                        "source": record["source"],
-                        "target": record["target"]})
-        logger.info(f"Identified {len(min_cut_relationships)} relationships in the min-cut")
-        return min_cut_relationships
 
 def find_min_cut(
     start_node_id,
@@ -508,7 +1315,8 @@ def find_min_cut(
     uri="bolt://localhost:7687",
     user="neo4j",
     password="password",
-    ids_are_node_ids=False
+    ids_are_node_ids=False,
+    database=None
 ):
     """
     Find minimum cut between start and end nodes in an undirected graph using edge-disjoint paths.
@@ -516,28 +1324,28 @@ def find_min_cut(
     Args:
         start_node_id: ID of the start node
         end_node_id: ID of the end node
-        relationship_types: List of relationship types to traverse
-        node_labels: List of node labels to consider
+        relationship_types: Sequence (list or tuple) of relationship types to traverse
+        node_labels: Sequence (list or tuple) of node labels to consider
         max_path_length: Maximum path length to consider
         uri: Neo4j connection URI
         user: Neo4j username
         password: Neo4j password
+        ids_are_node_ids: Treat start_node_id and end_node_id as integer node
+            IDs and look up their element IDs first
+        database: Name of the Neo4j database to run queries against; None
+            uses the user's home database
         
     Returns:
         List of relationship IDs that form the minimum cut
     """
-    finder = MinCutFinder(uri, user, password)
+    finder = _get_finder(uri, user, password, database)
     if ids_are_node_ids:
-        start_node_id = finder.get_element_id_from_id(start_node_id)
-        end_node_id = finder.get_element_id_from_id(end_node_id)
+        start_node_id, end_node_id = finder.get_element_ids_from_ids([start_node_id, end_node_id])
 
-    try:
-        return finder.find_min_cut(
-            start_node_id,
-            end_node_id,
-            relationship_types,
-            node_labels,
-            max_path_length
-        )
-    finally:
-        finder.close()
+    return finder.find_min_cut(
+        start_node_id,
+        end_node_id,
+        relationship_types,
+        node_labels,
+        max_path_length
+    )
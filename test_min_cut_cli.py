@@ -0,0 +1,169 @@
+"""
+Test cases for the min-cut command-line utility.
+
+These tests cover argument handling and output writing with a stand-in finder,
+so unlike test_mincut.py they do not need a running Neo4j instance.
+"""
+
+import io
+import json
+
+import pytest
+
+from min_cut_cli import (
+    NO_MIN_CUT_MESSAGE,
+    _Tee,
+    format_output,
+    main,
+    parse_args,
+    resolve_password,
+    save_to_file,
+    write_output,
+)
+
+MIN_CUT = [
+    {"id": "5:abc:1", "source": "4:abc:2", "target": "4:abc:3", "type": "TEST_REL"},
+    {"id": "5:abc:4", "source": "4:abc:5", "target": "4:abc:6", "type": "TEST_REL"},
+]
+
+REQUIRED_ARGS = ["--node-labels", "TestNode", "--relationship-types", "TEST_REL"]
+
+
+class FakeFinder:
+    """Stand-in for a connected MinCutFinder that records how it is called."""
+
+    def __init__(self, min_cut=MIN_CUT, error=None):
+        self.min_cut = min_cut
+        self.error = error
+        self.lookups = []
+        self.calls = []
+
+    def get_element_ids_from_ids(self, node_ids):
+        self.lookups.append(list(node_ids))
+        return [f"4:abc:{node_id}" for node_id in node_ids]
+
+    def find_min_cut(self, start_node_id, end_node_id, relationship_types, node_labels, max_path_length=10):
+        self.calls.append((start_node_id, end_node_id, relationship_types, node_labels, max_path_length))
+        if self.error is not None:
+            raise self.error
+        return self.min_cut
+
+
+@pytest.mark.parametrize("output_format", ["json", "table", "text"])
+@pytest.mark.parametrize("min_cut", [MIN_CUT, []])
+def test_write_output_matches_format_output(output_format, min_cut):
+    """Streaming the output gives the same text as formatting it in one piece."""
+    out = io.StringIO()
+    write_output(min_cut, output_format, out)
+    assert out.getvalue() == format_output(min_cut, output_format) + "\n"
+
+
+@pytest.mark.parametrize("compact, options", [(False, {"indent": 2}), (True, {"separators": (",", ":")})])
+def test_write_output_json(compact, options):
+    """JSON output is exactly what json.dumps gives, non-ASCII escaping included."""
+    min_cut = MIN_CUT + [{"id": "5:abc:7", "source": "4:abc:8", "target": "4:abc:9", "type": "GRÜSST"}]
+    out = io.StringIO()
+    write_output(min_cut, "json", out, compact=compact)
+    assert out.getvalue() == json.dumps(min_cut, **options) + "\n"
+    assert "\\u00dc" in out.getvalue()
+
+
+def test_write_output_no_min_cut():
+    """An empty cut prints the explanatory message in every format."""
+    out = io.StringIO()
+    write_output([], "json", out)
+    assert out.getvalue() == NO_MIN_CUT_MESSAGE + "\n"
+
+
+def test_tee_writes_to_every_stream():
+    """_Tee forwards each write to all of its streams."""
+    first, second = io.StringIO(), io.StringIO()
+    tee = _Tee(first, second)
+    tee.write("a")
+    tee.write("b\n")
+    assert first.getvalue() == second.getvalue() == "ab\n"
+
+
+def test_save_to_file(tmp_path):
+    """save_to_file hands the open file to writer_fn and reports success."""
+    path = tmp_path / "cut.txt"
+    assert save_to_file(lambda f: f.write("content\n"), str(path)) is True
+    assert path.read_text() == "content\n"
+
+
+def test_save_to_file_unwritable(tmp_path):
+    """A file that cannot be opened is reported, and writer_fn is not called."""
+    calls = []
+    assert save_to_file(calls.append, str(tmp_path / "missing" / "cut.txt")) is False
+    assert calls == []
+
+
+def test_resolve_password(monkeypatch):
+    """--password wins over $NEO4J_PASSWORD, which wins over the default."""
+    monkeypatch.delenv("NEO4J_PASSWORD", raising=False)
+    args = parse_args(["--start-node", "1", "--end-node", "2"] + REQUIRED_ARGS)
+    assert resolve_password(args) == "password"
+
+    monkeypatch.setenv("NEO4J_PASSWORD", "from-env")
+    assert resolve_password(args) == "from-env"
+
+    args = parse_args(["--start-node", "1", "--end-node", "2", "--password", "from-arg"] + REQUIRED_ARGS)
+    assert resolve_password(args) == "from-arg"
+
+
+def test_parse_args_node_ids():
+    """Node IDs are integers unless --element-ids is given."""
+    args = parse_args(["--start-node", "1", "--end-node", "2"] + REQUIRED_ARGS)
+    assert (args.start_node, args.end_node) == (1, 2)
+
+    args = parse_args(["--start-node", "4:abc:1", "--end-node", "4:abc:2", "--element-ids"] + REQUIRED_ARGS)
+    assert (args.start_node, args.end_node) == ("4:abc:1", "4:abc:2")
+
+    with pytest.raises(SystemExit):
+        parse_args(["--start-node", "4:abc:1", "--end-node", "4:abc:2"] + REQUIRED_ARGS)
+
+
+def test_parse_args_database():
+    """The driver picks the home database unless --database is given."""
+    args = parse_args(["--start-node", "1", "--end-node", "2"] + REQUIRED_ARGS)
+    assert args.database is None
+
+    args = parse_args(["--start-node", "1", "--end-node", "2", "--database", "mygraph"] + REQUIRED_ARGS)
+    assert args.database == "mygraph"
+
+
+def test_main_resolves_node_ids(capsys):
+    """Integer node IDs are looked up in one batch before the min-cut runs."""
+    finder = FakeFinder()
+    assert main(["--start-node", "1", "--end-node", "2"] + REQUIRED_ARGS, finder=finder) == 0
+    assert finder.lookups == [[1, 2]]
+    assert finder.calls == [("4:abc:1", "4:abc:2", ("TEST_REL",), ("TestNode",), 10)]
+    assert capsys.readouterr().out == format_output(MIN_CUT, "text") + "\n"
+
+
+def test_main_element_ids_skip_lookup():
+    """With --element-ids the IDs go to find_min_cut unchanged."""
+    finder = FakeFinder()
+    argv = ["--start-node", "4:abc:1", "--end-node", "4:abc:2", "--element-ids"] + REQUIRED_ARGS
+    assert main(argv, finder=finder) == 0
+    assert finder.lookups == []
+    assert finder.calls[0][:2] == ("4:abc:1", "4:abc:2")
+
+
+def test_main_output_file(tmp_path, capsys):
+    """--output-file gets exactly what is printed to stdout."""
+    path = tmp_path / "cut.json"
+    argv = [
+        "--start-node", "1", "--end-node", "2",
+        "--output-format", "json", "--compact", "--output-file", str(path)
+    ] + REQUIRED_ARGS
+    assert main(argv, finder=FakeFinder()) == 0
+    printed = capsys.readouterr().out
+    assert path.read_text() == printed
+    assert json.loads(printed) == MIN_CUT
+
+
+def test_main_reports_errors():
+    """A failing min-cut gives exit code 1."""
+    finder = FakeFinder(error=ValueError("No min-cut exists between the specified nodes"))
+    assert main(["--start-node", "1", "--end-node", "2"] + REQUIRED_ARGS, finder=finder) == 1
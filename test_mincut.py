@@ -2,230 +2,524 @@
 Test cases for the Neo4j Min-Cut algorithm.
 
 This module provides test cases for the min_cut module. It requires a running Neo4j 
-instance with APOC and GDS plugins installed.
+instance with APOC and GDS plugins installed, and pytest to run the tests.
 """
 
+import asyncio
 import logging
-import unittest
-from mincut import find_min_cut, MinCutFinder
+import pytest
+import mincut
+from mincut import AsyncMinCutFinder, MinCutFinder, find_min_cut
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Configure logging (only if the test runner has not done so already)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class TestMinCut(unittest.TestCase):
-    """Test cases for the min_cut module."""
+# Connection settings; DATABASE None uses the user's home database
+URI = "bolt://localhost:7687"
+USER = "neo4j"
+PASSWORD = "password"
+DATABASE = None
+
+
+def _create_test_graph(session):
+    """Create a sample graph for testing the min-cut algorithm."""
+    # Create a simple graph with a known min-cut
+    # The graph is a modified version of a diamond graph with additional edges
+    #
+    #      (2)---(3)
+    #     /|     /|
+    #    / |    / |
+    #   /  |   /  |
+    # (1)  |  /   |
+    #   \  | /    |
+    #    \ |/     |
+    #     (4)---(5)
+    #
+    # Min-cut between nodes 1 and 5 should be edges (2,3) and (4,5)
     
-    def setUp(self):
-        """Set up test database with a sample graph."""
-        self.uri = "bolt://localhost:7687"
-        self.user = "neo4j"
-        self.password = "password"
-        
-        self.finder = MinCutFinder(self.uri, self.user, self.password)
+    nodes = [{"id": i, "name": f"Node{i}"} for i in range(1, 6)]
+    edges = [
+        {"s": 1, "t": 2, "w": 1},
+        {"s": 1, "t": 4, "w": 1},
+        {"s": 2, "t": 3, "w": 1},
+        {"s": 2, "t": 4, "w": 1},
+        {"s": 3, "t": 4, "w": 1},
+        {"s": 3, "t": 5, "w": 1},
+        {"s": 4, "t": 5, "w": 1}
+    ]
+    
+    # One parameterized MERGE script: the plan is cached, and an existing
+    # graph is matched through the name constraint instead of recreated
+    query = """
+    UNWIND $nodes AS n
+    MERGE (node:TestNode {name: n.name})
+    ON CREATE SET node.id = n.id
+    WITH count(*) AS created
+    UNWIND $edges AS e
+    MATCH (a:TestNode {id: e.s}), (b:TestNode {id: e.t})
+    MERGE (a)-[:TEST_REL {weight: e.w}]->(b)
+    """
+    
+    def _create(tx):
+        tx.run(query, nodes=nodes, edges=edges).consume()
+    
+    session.execute_write(_create)
+    
+    logger.info("Created test graph for min-cut testing")
+
+
+def _clean_test_graph(session):
+    """Remove the test graph."""
+    # Delete in batches so a large test graph never needs one huge transaction
+    query = """
+    CALL apoc.periodic.iterate(
+        'MATCH (n:TestNode) RETURN n',
+        'DETACH DELETE n',
+        {batchSize: 10000, parallel: false}
+    )
+    """
+    
+    # apoc.periodic.iterate commits its own batches, so it runs auto-commit.
+    # It reports failed batches in its result row instead of raising.
+    record = session.run(query).single(strict=True)
+    if record["failedBatches"] > 0:
+        raise RuntimeError(
+            f"Failed to clean up {record['failedBatches']} batches of the test graph: "
+            f"{record['errorMessages']}"
+        )
+    logger.info("Cleaned up test graph")
+
+
+def _endpoint_ids(session):
+    """Return the element IDs of the start and end node of the test graph."""
+    query = """
+    MATCH (start:TestNode {name: 'Node1'})
+    MATCH (end:TestNode {name: 'Node5'})
+    RETURN elementId(start) as start_id, elementId(end) as end_id
+    """
+    
+    # strict=True raises ResultNotSingleError when the nodes are missing
+    start_id, end_id = session.execute_read(
+        lambda tx: tx.run(query).single(strict=True).values()
+    )
+    return start_id, end_id
+
+
+def _verify_tx(tx, rel_ids):
+    """Return the endpoint names of the given relationships in one read transaction."""
+    # Aggregate into a single record instead of streaming one record per relationship
+    query = """
+    UNWIND $rel_ids AS rel_id
+    MATCH ()-[r]->() WHERE elementId(r) = rel_id
+    WITH r ORDER BY elementId(r)
+    RETURN collect({id: elementId(r), s: startNode(r).name, t: endNode(r).name}) AS rows
+    """
+    
+    return tx.run(query, rel_ids=rel_ids).single(strict=True)["rows"]
+
+
+def _graph_cases():
+    """
+    Yield small graphs with a known min-cut between nodes S and T.
+    
+    Each case is a list of (source, target) edges and the set of edges
+    expected in the cut.
+    """
+    # A single path: the cut is the edge leaving S
+    yield [("S", "A"), ("A", "T")], {("S", "A")}
+    # Two edge-disjoint paths: both edges leaving S are cut
+    yield [("S", "A"), ("A", "T"), ("S", "B"), ("B", "T")], {("S", "A"), ("S", "B")}
+    # A dead-end branch at S is not on any path and stays out of the cut
+    yield [("S", "A"), ("A", "T"), ("S", "C")], {("S", "A")}
+
+
+def _create_case_graph(session, edges):
+    """
+    Create one case graph and return the element IDs of S and T.
+    
+    Args:
+        session: Open session to create the graph in
+        edges: List of (source, target) name pairs to create
+    """
+    query = """
+    UNWIND $edges AS e
+    MERGE (a:TestCaseNode {name: e[0]})
+    MERGE (b:TestCaseNode {name: e[1]})
+    CREATE (a)-[:TEST_REL {weight: 1}]->(b)
+    WITH count(*) AS created
+    MATCH (start:TestCaseNode {name: 'S'})
+    MATCH (end:TestCaseNode {name: 'T'})
+    RETURN elementId(start) as start_id, elementId(end) as end_id
+    """
+    
+    return session.execute_write(
+        lambda tx: tx.run(query, edges=[list(edge) for edge in edges]).single(strict=True).values()
+    )
+
+
+def _cut_endpoints(session, min_cut):
+    """Return the set of (source name, target name) pairs of a min-cut."""
+    endpoints = session.execute_read(_verify_tx, [rel["id"] for rel in min_cut])
+    return {(record["s"], record["t"]) for record in endpoints}
+
+
+def _clean_case_graph(session):
+    """Remove the case graphs created by _create_case_graph."""
+    session.execute_write(
+        lambda tx: tx.run("MATCH (n:TestCaseNode) DETACH DELETE n").consume()
+    )
+
+
+def _drop_schema(session, drop_queries):
+    """Run the given DROP INDEX/CONSTRAINT statements, logging failures."""
+    for query in drop_queries:
         try:
-            self.finder.connect()
-            # Create test graph if needed
-            self._create_test_graph()
+            session.run(query).consume()
         except Exception as e:
-            logger.error(f"Error setting up test: {str(e)}")
-            self.skipTest(f"Could not connect to Neo4j: {str(e)}")
+            logger.warning("Error dropping schema: %s", e)
+
+
+@pytest.fixture(scope="module")
+def finder():
+    """Yield a connected MinCutFinder shared by all tests in the module."""
+    finder = MinCutFinder(URI, USER, PASSWORD, database=DATABASE)
+    try:
+        finder.connect()
+    except Exception as e:
+        logger.error("Error setting up test: %s", e)
+        finder.close()
+        pytest.skip(f"Could not connect to Neo4j: {str(e)}")
+    
+    yield finder
+    finder.close()
+
+
+@pytest.fixture(scope="module")
+def session(finder):
+    """Yield one session that serves setup, the tests and cleanup."""
+    session = finder.driver.session(database=DATABASE)
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="module")
+def graph(session):
+    """Create the sample graph once and yield the element IDs of its start and end node."""
+    # Schema objects the fixture creates, with the statement that removes each
+    schema = [
+        (
+            "CREATE INDEX test_node_id IF NOT EXISTS FOR (n:TestNode) ON (n.id)",
+            "DROP INDEX test_node_id IF EXISTS"
+        ),
+        (
+            "CREATE CONSTRAINT test_node_name IF NOT EXISTS FOR (n:TestNode) REQUIRE n.name IS UNIQUE",
+            "DROP CONSTRAINT test_node_name IF EXISTS"
+        ),
+    ]
+    # Only what this run actually created is dropped again, never an existing object
+    created = []
+    try:
+        for create_query, drop_query in schema:
+            counters = session.run(create_query).consume().counters
+            if counters.indexes_added or counters.constraints_added:
+                created.append(drop_query)
+        # Do not let the first test race the index population
+        session.run("CALL db.awaitIndexes(30)").consume()
+        # Create test graph unless it already exists
+        _create_test_graph(session)
+        # The endpoint IDs do not change while the graph exists
+        endpoint_ids = _endpoint_ids(session)
+    except Exception as e:
+        logger.error("Error setting up test: %s", e)
+        _drop_schema(session, created)
+        pytest.skip(f"Could not create the test graph: {str(e)}")
+    
+    yield endpoint_ids
+    
+    try:
+        _clean_test_graph(session)
+    except Exception as e:
+        logger.warning("Error cleaning up: %s", e)
+    finally:
+        _drop_schema(session, created)
+
+
+def test_min_cut_basic(finder, session, graph):
+    """Test the min-cut algorithm on a basic graph."""
+    start_id, end_id = graph
+    
+    # Find min-cut
+    min_cut = finder.find_min_cut(
+        start_id,
+        end_id,
+        ["TEST_REL"],
+        ["TestNode"],
+        max_path_length=5
+    )
     
-    def tearDown(self):
-        """Clean up test database."""
-        if hasattr(self, 'finder') and self.finder:
-            try:
-                # Clean up test graph
-                self._clean_test_graph()
-            except Exception as e:
-                logger.warning(f"Error cleaning up: {str(e)}")
-            finally:
-                self.finder.close()
+    # Verify results
+    assert min_cut is not None
+    assert len(min_cut) == 2, "Expected 2 relationships in the min-cut"
     
-    def _create_test_graph(self):
-        """Create a sample graph for testing the min-cut algorithm."""
-        with self.finder.driver.session() as session:
-            # Check if the test graph already exists
-            result = session.run("MATCH (n:TestNode) RETURN count(n) as count")
-            count = result.single()["count"]
-            
-            if count > 0:
-                logger.info("Test graph already exists, skipping creation")
-                return
-            
-            # Create a simple graph with a known min-cut
-            # The graph is a modified version of a diamond graph with additional edges
-            #
-            #      (2)---(3)
-            #     /|     /|
-            #    / |    / |
-            #   /  |   /  |
-            # (1)  |  /   |
-            #   \  | /    |
-            #    \ |/     |
-            #     (4)---(5)
-            #
-            # Min-cut between nodes 1 and 5 should be edges (2,3) and (4,5)
-            
-            query = """
-            CREATE 
-              (n1:TestNode {name: 'Node1'}),
-              (n2:TestNode {name: 'Node2'}),
-              (n3:TestNode {name: 'Node3'}),
-              (n4:TestNode {name: 'Node4'}),
-              (n5:TestNode {name: 'Node5'}),
-              (n1)-[:TEST_REL {weight: 1}]->(n2),
-              (n1)-[:TEST_REL {weight: 1}]->(n4),
-              (n2)-[:TEST_REL {weight: 1}]->(n3),
-              (n2)-[:TEST_REL {weight: 1}]->(n4),
-              (n3)-[:TEST_REL {weight: 1}]->(n4),
-              (n3)-[:TEST_REL {weight: 1}]->(n5),
-              (n4)-[:TEST_REL {weight: 1}]->(n5)
-            RETURN n1, n5
-            """
-            
-            result = session.run(query)
-            record = result.single()
-            
-            logger.info("Created test graph for min-cut testing")
+    # Get the names of the nodes connected by the min-cut relationships
+    # to verify we got the expected cut
+    endpoints = session.execute_read(_verify_tx, [rel["id"] for rel in min_cut])
+    relationship_endpoints = [(record["s"], record["t"]) for record in endpoints]
     
-    def _clean_test_graph(self):
-        """Remove the test graph."""
-        with self.finder.driver.session() as session:
-            query = """
-            MATCH (n:TestNode)
-            DETACH DELETE n
-            """
-            
-            session.run(query)
-            logger.info("Cleaned up test graph")
+    # Expected min-cut is the edges (Node2, Node3) and (Node4, Node5)
+    assert set(relationship_endpoints) == {("Node2", "Node3"), ("Node4", "Node5")}
     
-    def test_min_cut_basic(self):
-        """Test the min-cut algorithm on a basic graph."""
-        # First get node IDs
-        with self.finder.driver.session() as session:
-            query = """
-            MATCH (start:TestNode {name: 'Node1'})
-            MATCH (end:TestNode {name: 'Node5'})
-            RETURN id(start) as start_id, id(end) as end_id
-            """
-            
-            result = session.run(query)
-            record = result.single()
-            
-            if not record:
-                self.skipTest("Test nodes not found in database")
-            
-            start_id = record["start_id"]
-            end_id = record["end_id"]
+    logger.info("Min-cut test passed with cuts: %s", relationship_endpoints)
+
+
+def _node_ids(session, element_ids):
+    """Return the integer node IDs of nodes given by element ID, in the same order."""
+    query = """
+    UNWIND $element_ids AS element_id
+    MATCH (n) WHERE elementId(n) = element_id
+    RETURN id(n) AS node_id
+    """
+    
+    return session.execute_read(
+        lambda tx: [record["node_id"] for record in tx.run(query, element_ids=element_ids)]
+    )
+
+
+def test_get_element_ids_from_ids(finder, session, graph):
+    """The batched lookup keeps the requested order and rejects unknown nodes."""
+    start_id, end_id = graph
+    start_node_id, end_node_id = _node_ids(session, [start_id, end_id])
+    
+    assert finder.get_element_ids_from_ids([end_node_id, start_node_id, end_node_id]) == [end_id, start_id, end_id]
+    assert finder.get_element_id_from_id(start_node_id) == start_id
+    with pytest.raises(ValueError):
+        finder.get_element_ids_from_ids([start_node_id, -1])
+
+
+def test_module_find_min_cut_with_node_ids(finder, session, graph):
+    """The module-level function resolves node IDs and matches the finder's result."""
+    start_id, end_id = graph
+    start_node_id, end_node_id = _node_ids(session, [start_id, end_id])
+    
+    min_cut = find_min_cut(
+        start_node_id,
+        end_node_id,
+        ["TEST_REL"],
+        ["TestNode"],
+        max_path_length=5,
+        uri=URI,
+        user=USER,
+        password=PASSWORD,
+        ids_are_node_ids=True,
+        database=DATABASE
+    )
+    expected = finder.find_min_cut(start_id, end_id, ["TEST_REL"], ["TestNode"], max_path_length=5)
+    assert _cut_endpoints(session, min_cut) == _cut_endpoints(session, expected)
+
+
+def test_async_min_cut(finder, session, graph):
+    """AsyncMinCutFinder matches the sync result, for one call and two concurrent calls."""
+    start_id, end_id = graph
+    expected = _cut_endpoints(
+        session,
+        finder.find_min_cut(start_id, end_id, ["TEST_REL"], ["TestNode"], max_path_length=5)
+    )
+    
+    async def run():
+        async with AsyncMinCutFinder(URI, USER, PASSWORD, database=DATABASE) as async_finder:
+            single = await async_finder.find_min_cut(start_id, end_id, ["TEST_REL"], ["TestNode"], max_path_length=5)
+            concurrent = await asyncio.gather(*(
+                async_finder.find_min_cut(start_id, end_id, ["TEST_REL"], ["TestNode"], max_path_length=5)
+                for _ in range(2)
+            ))
+            return [single, *concurrent]
+    
+    for min_cut in asyncio.run(run()):
+        assert _cut_endpoints(session, min_cut) == expected
+
+
+def test_async_min_cut_chunked(session, monkeypatch):
+    """Path sets split into chunks give the same cut as a single query."""
+    # The dead end keeps S in the projection, so the WCC path (not the
+    # isolated-start shortcut) runs
+    start_id, end_id = _create_case_graph(session, [("S", "A"), ("A", "T"), ("S", "C")])
+    # One relationship per chunk, so the gathered chunk queries really run
+    monkeypatch.setattr(mincut, "MIN_CUT_BATCH_SIZE", 1)
+    
+    async def run():
+        async with AsyncMinCutFinder(URI, USER, PASSWORD, database=DATABASE) as async_finder:
+            return await async_finder.find_min_cut(start_id, end_id, ["TEST_REL"], ["TestCaseNode"], max_path_length=5)
+    
+    try:
+        assert _cut_endpoints(session, asyncio.run(run())) == {("S", "A")}
+    finally:
+        _clean_case_graph(session)
+
+
+def test_min_cut_unknown_label(finder, graph):
+    """No node carries the labels: there are no paths, so the cut is empty."""
+    start_id, end_id = graph
+    assert finder.find_min_cut(start_id, end_id, ["TEST_REL"], ["NoSuchLabel"], max_path_length=5) == []
+
+
+def test_min_cut_unlabeled_start(finder, session):
+    """APOC starts paths at a start node without the labels; it must still be projected."""
+    start_id, end_id = _create_case_graph(session, [("S", "A"), ("A", "T"), ("S", "C")])
+    try:
+        session.execute_write(lambda tx: tx.run(
+            "MATCH (n:TestCaseNode {name: 'S'}) SET n:TestCaseStart REMOVE n:TestCaseNode"
+        ).consume())
         
-        # Find min-cut
-        min_cut = find_min_cut(
+        min_cut = finder.find_min_cut(start_id, end_id, ["TEST_REL"], ["TestCaseNode"], max_path_length=5)
+        assert _cut_endpoints(session, min_cut) == {("S", "A")}
+    finally:
+        session.execute_write(
+            lambda tx: tx.run("MATCH (n:TestCaseStart) DETACH DELETE n").consume()
+        )
+        _clean_case_graph(session)
+
+
+@pytest.mark.parametrize("edges, expected", list(_graph_cases()))
+def test_min_cut_cases(finder, session, edges, expected):
+    """Test the min-cut algorithm on further small graphs, sharing the session and driver."""
+    start_id, end_id = _create_case_graph(session, edges)
+    try:
+        min_cut = finder.find_min_cut(
             start_id,
             end_id,
             ["TEST_REL"],
-            ["TestNode"],
-            max_path_length=5,
-            uri=self.uri,
-            user=self.user,
-            password=self.password
+            ["TestCaseNode"],
+            max_path_length=5
         )
         
-        # Verify results
-        self.assertIsNotNone(min_cut)
-        self.assertEqual(len(min_cut), 2, "Expected 2 relationships in the min-cut")
+        assert _cut_endpoints(session, min_cut) == expected
+    finally:
+        _clean_case_graph(session)
+
+
+def test_min_cut_repeated_call(session):
+    """With caching, a repeated call reuses the projection, but still sees changed paths."""
+    start_id, end_id = _create_case_graph(session, [("S", "A"), ("A", "T"), ("S", "B"), ("B", "T")])
+    caching_finder = MinCutFinder(URI, USER, PASSWORD, database=DATABASE, caching=True)
+    try:
+        def cut():
+            return _cut_endpoints(
+                session,
+                caching_finder.find_min_cut(start_id, end_id, ["TEST_REL"], ["TestCaseNode"], max_path_length=5)
+            )
         
-        # Get the names of the nodes connected by the min-cut relationships
-        # to verify we got the expected cut
-        relationship_endpoints = []
-        with self.finder.driver.session() as session:
-            for rel in min_cut:
-                rel_id = rel["id"]
-                query = """
-                MATCH (a)-[r]->(b) WHERE id(r) = $rel_id
-                RETURN a.name as source_name, b.name as target_name
-                """
-                
-                result = session.run(query, rel_id=rel_id)
-                record = result.single()
-                
-                if record:
-                    relationship_endpoints.append((record["source_name"], record["target_name"]))
+        assert cut() == {("S", "A"), ("S", "B")}
+        assert cut() == {("S", "A"), ("S", "B")}
         
-        # Expected min-cut is the edges (Node2, Node3) and (Node4, Node5)
-        expected_endpoints = [
-            ("Node2", "Node3"),
-            ("Node4", "Node5")
-        ]
+        # Reroute one path through a new node, without resetting the cache
+        session.execute_write(lambda tx: tx.run("""
+        MATCH (:TestCaseNode {name: 'S'})-[r]->(:TestCaseNode {name: 'B'})
+        DELETE r
+        WITH count(*) AS deleted
+        MATCH (s:TestCaseNode {name: 'S'}), (t:TestCaseNode {name: 'T'})
+        CREATE (s)-[:TEST_REL {weight: 1}]->(:TestCaseNode {name: 'C'})-[:TEST_REL {weight: 1}]->(t)
+        """).consume())
         
-        # Sort both lists to make comparison reliable
-        relationship_endpoints.sort()
-        expected_endpoints.sort()
-        
-        for i, endpoint_pair in enumerate(relationship_endpoints):
-            self.assertIn(
-                endpoint_pair, 
-                expected_endpoints, 
-                f"Unexpected relationship in min-cut: {endpoint_pair}"
+        assert cut() == {("S", "A"), ("S", "C")}
+    finally:
+        caching_finder.close()
+        _clean_case_graph(session)
+
+
+def test_min_cut_two_finders(session, graph):
+    """Caching finders keep separate projections: interleaved calls and close() do not interfere."""
+    start_id, end_id = graph
+    case_start_id, case_end_id = _create_case_graph(session, [("S", "A"), ("A", "T")])
+    finder = MinCutFinder(URI, USER, PASSWORD, database=DATABASE, caching=True)
+    other = MinCutFinder(URI, USER, PASSWORD, database=DATABASE, caching=True)
+    try:
+        def cut(cut_finder, start, end, label):
+            return _cut_endpoints(
+                session,
+                cut_finder.find_min_cut(start, end, ["TEST_REL"], [label], max_path_length=5)
             )
         
-        logger.info(f"Min-cut test passed with cuts: {relationship_endpoints}")
+        first = cut(finder, start_id, end_id, "TestNode")
+        assert cut(other, case_start_id, case_end_id, "TestCaseNode") == {("S", "A")}
+        assert cut(finder, start_id, end_id, "TestNode") == first
+        
+        # Closing one finder must not drop the other's projection
+        finder.close()
+        assert cut(other, case_start_id, case_end_id, "TestCaseNode") == {("S", "A")}
+    finally:
+        finder.close()
+        other.close()
+        _clean_case_graph(session)
 
 
 # Demo function to show usage in a more practical context
-def demo_min_cut():
+def demo_min_cut(finder=None):
     """
     Demonstrate the usage of the min-cut algorithm with a simple example.
     
     This function creates a sample graph, finds the min-cut, and displays the results.
+    
+    Args:
+        finder: Existing MinCutFinder to run the demo with; if omitted, the demo
+            creates its own and closes it when done. The caller stays responsible
+            for closing a finder it passes in.
     """
-    # Connect to Neo4j
-    finder = MinCutFinder()
+    owns_finder = finder is None
+    if owns_finder:
+        # Connect to Neo4j
+        finder = MinCutFinder()
+    session = None
+    # Index created by this run, dropped again at the end of the demo
+    created_index = False
     try:
-        finder.connect()
+        if not finder.driver:
+            finder.connect()
+        # One session serves every query of the demo
+        session = finder.driver.session(database=finder.database)
+        # Endpoint lookups by name become index seeks
+        counters = session.run(
+            "CREATE INDEX demo_node_name_idx IF NOT EXISTS FOR (n:DemoNode) ON (n.name)"
+        ).consume().counters
+        created_index = counters.indexes_added > 0
+        session.run("CALL db.awaitIndexes(30)").consume()
+        
+        # Create a sample graph representing a network
+        nodes = [{"name": name} for name in "ABCDEFG"]
+        edges = [
+            {"s": "A", "t": "B", "capacity": 3},
+            {"s": "A", "t": "D", "capacity": 5},
+            {"s": "B", "t": "C", "capacity": 2},
+            {"s": "B", "t": "E", "capacity": 3},
+            {"s": "C", "t": "G", "capacity": 4},
+            {"s": "D", "t": "E", "capacity": 2},
+            {"s": "E", "t": "C", "capacity": 1},
+            {"s": "E", "t": "F", "capacity": 4},
+            {"s": "F", "t": "G", "capacity": 6}
+        ]
+        
+        # Create the graph and return the source/target IDs in the same query
+        create_query = """
+        UNWIND $nodes AS n
+        CREATE (:DemoNode {name: n.name})
+        WITH count(*) AS created_nodes
+        UNWIND $edges AS e
+        MATCH (a:DemoNode {name: e.s}), (b:DemoNode {name: e.t})
+        CREATE (a)-[:CONNECTS {capacity: e.capacity}]->(b)
+        WITH count(*) AS created_rels
+        MATCH (source:DemoNode {name: 'A'})
+        MATCH (target:DemoNode {name: 'G'})
+        RETURN elementId(source) as source_id, elementId(target) as target_id
+        """
         
-        # Create a sample graph
-        with finder.driver.session() as session:
-            # Clear any existing demo data
-            session.run("MATCH (n:DemoNode) DETACH DELETE n")
-            
-            # Create a graph representing a network
-            query = """
-            CREATE 
-              (a:DemoNode {name: 'A'}),
-              (b:DemoNode {name: 'B'}),
-              (c:DemoNode {name: 'C'}),
-              (d:DemoNode {name: 'D'}),
-              (e:DemoNode {name: 'E'}),
-              (f:DemoNode {name: 'F'}),
-              (g:DemoNode {name: 'G'}),
-              (a)-[:CONNECTS {capacity: 3}]->(b),
-              (a)-[:CONNECTS {capacity: 5}]->(d),
-              (b)-[:CONNECTS {capacity: 2}]->(c),
-              (b)-[:CONNECTS {capacity: 3}]->(e),
-              (c)-[:CONNECTS {capacity: 4}]->(g),
-              (d)-[:CONNECTS {capacity: 2}]->(e),
-              (e)-[:CONNECTS {capacity: 1}]->(c),
-              (e)-[:CONNECTS {capacity: 4}]->(f),
-              (f)-[:CONNECTS {capacity: 6}]->(g)
-            RETURN a, g
-            """
-            
-            result = session.run(query)
-            record = result.single()
-            
-            # Get node IDs for source and target
-            query = """
-            MATCH (source:DemoNode {name: 'A'})
-            MATCH (target:DemoNode {name: 'G'})
-            RETURN id(source) as source_id, id(target) as target_id
-            """
-            
-            result = session.run(query)
-            record = result.single()
-            
-            source_id = record["source_id"]
-            target_id = record["target_id"]
+        def _create(tx):
+            # Clear any existing demo data in the same transaction
+            tx.run("MATCH (n:DemoNode) DETACH DELETE n").consume()
+            result = tx.run(create_query, nodes=nodes, edges=edges)
+            return result.single(strict=True).values()
+        
+        source_id, target_id = session.execute_write(_create)
         
         # Find the min-cut
         min_cut = finder.find_min_cut(
@@ -240,18 +534,22 @@ def demo_min_cut():
         print("\n===== Min-Cut Demo =====")
         print(f"Found {len(min_cut)} relationships in the min-cut:")
         
-        with finder.driver.session() as session:
-            for i, rel in enumerate(min_cut):
-                rel_id = rel["id"]
-                query = """
-                MATCH (a)-[r]->(b) WHERE id(r) = $rel_id
-                RETURN a.name as source, b.name as target, r.capacity as capacity
-                """
-                
-                result = session.run(query, rel_id=rel_id)
-                record = result.single()
-                
-                print(f"{i+1}. {record['source']} -> {record['target']} (Capacity: {record['capacity']})")
+        query = """
+        UNWIND $rel_ids AS rel_id
+        MATCH ()-[r]->() WHERE elementId(r) = rel_id
+        RETURN elementId(r) as rel_id, startNode(r).name as source, endNode(r).name as target,
+               r.capacity as capacity
+        """
+        
+        # One list parameter covers the whole cut in a single round trip
+        rel_ids = [rel["id"] for rel in min_cut]
+        rows = session.execute_read(lambda tx: tx.run(query, rel_ids=rel_ids).data())
+        records = {record["rel_id"]: record for record in rows}
+        
+        # Print in min-cut order, not in the order the rows came back
+        for i, rel in enumerate(min_cut):
+            record = records[rel["id"]]
+            print(f"{i+1}. {record['source']} -> {record['target']} (Capacity: {record['capacity']})")
         
         print("\nThese relationships represent the minimum cut in the network.")
         print("Removing these edges would disconnect the source from the target")
@@ -260,16 +558,24 @@ def demo_min_cut():
     except Exception as e:
         print(f"Error in demo: {str(e)}")
     finally:
-        finder.close()
+        if session is not None:
+            if created_index:
+                _drop_schema(session, ["DROP INDEX demo_node_name_idx IF EXISTS"])
+            session.close()
+        if owns_finder:
+            finder.close()
 
 
 if __name__ == "__main__":
     print("Running min-cut algorithm tests...")
-    unittest.main(argv=['first-arg-is-ignored'], exit=False)
+    pytest.main([__file__])
     
     print("\nRunning min-cut demo...")
+    finder = MinCutFinder()
     try:
-        demo_min_cut()
+        demo_min_cut(finder)
     except Exception as e:
         print(f"Demo failed: {str(e)}")
         print("Ensure Neo4j is running with APOC and GDS plugins installed.")
+    finally:
+        finder.close()